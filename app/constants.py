@@ -5,12 +5,24 @@ APP_VERSION = "1.2.1"
 
 # Timing constants used across services
 PROGRESS_THROTTLE_SEC = 0.25
-EVENT_POLL_INTERVAL_MS = 120
+EVENT_POLL_INTERVAL_MS = 250
 WATCH_SCAN_INTERVAL_MS = 3000
 WATCH_DEBOUNCE_SEC = 2.0
+PROBE_DEBOUNCE_MS = 150
+PRESET_SAVE_DELAY_MS = 500
+THEME_APPLY_DELAY_MS = 50
+THEME_SAVE_DELAY_MS = 2000
 RESOURCE_SAMPLE_INTERVAL_SEC = 2.0
 ANALYTICS_EMIT_INTERVAL_SEC = 2.0
 
+# Log retention: rows kept in the on-screen log view / lines kept for export
+LOG_VIEW_MAX_LINES = 2000
+LOG_HISTORY_MAX_LINES = 20000
+MEDIA_INFO_MEMORY_LIMIT = 2000
+
+# Folder scans hand files to the queue in chunks of this many paths
+FOLDER_SCAN_CHUNK_SIZE = 200
+
 VIDEO_EXTS = {".mov", ".mp4", ".mkv", ".webm", ".avi", ".m4v", ".flv", ".wmv", ".mts", ".m2ts"}
 IMAGE_EXTS = {".jpg", ".jpeg", ".png", ".webp", ".bmp", ".tif", ".tiff", ".heic", ".heif"}
 AUDIO_EXTS = {".mp3", ".m4a", ".aac", ".wav", ".flac", ".opus", ".ogg", ".wma", ".aiff", ".aif", ".mka"}
@@ -51,6 +63,30 @@ TEXT_EXTS = {
     ".otp",
 }
 
+_VIDEO_PATTERNS = "*.mp4 *.mov *.mkv *.webm *.avi *.m4v *.flv *.wmv *.mts *.m2ts"
+_IMAGE_PATTERNS = "*.jpg *.jpeg *.png *.bmp *.webp *.tiff *.heic *.heif"
+_AUDIO_PATTERNS = "*.mp3 *.m4a *.aac *.wav *.flac *.opus *.ogg *.wma *.aiff *.mka"
+_SUBTITLE_PATTERNS = "*.srt *.ass *.ssa *.vtt *.webvtt"
+_TEXT_PATTERNS = (
+    "*.txt *.md *.markdown *.html *.htm *.json *.csv *.tsv *.xml *.yaml *.yml *.log *.rtf "
+    "*.pdf *.docx *.docm *.dotx *.doc *.odt *.ott "
+    "*.xlsx *.xlsm *.xltx *.xls *.ods *.ots "
+    "*.pptx *.pptm *.ppsx *.potx *.ppt *.odp *.otp"
+)
+
+# Qt file dialog filters, formatted once per process.
+FILE_DIALOG_FILTERS = {
+    "all": (
+        f"Media Files ({_VIDEO_PATTERNS} {_IMAGE_PATTERNS} {_AUDIO_PATTERNS} {_SUBTITLE_PATTERNS} {_TEXT_PATTERNS})"
+        ";;All Files (*)"
+    ),
+    "video": f"Video Files ({_VIDEO_PATTERNS});;All Files (*)",
+    "image": f"Photo Files ({_IMAGE_PATTERNS});;All Files (*)",
+    "audio": f"Audio Files ({_AUDIO_PATTERNS});;All Files (*)",
+    "subtitle": f"Subtitle Files ({_SUBTITLE_PATTERNS});;All Files (*)",
+    "text": f"Text and Office Files ({_TEXT_PATTERNS});;All Files (*)",
+}
+
 OUT_VIDEO_FORMATS = ["mp4", "mkv", "webm", "mov", "avi", "gif", "mpg", "m2ts"]
 OUT_IMAGE_FORMATS = ["jpg", "png", "webp", "bmp", "tiff"]
 OUT_AUDIO_FORMATS = ["mp3", "m4a", "aac", "wav", "flac", "opus"]
@@ -74,6 +110,12 @@ OUT_TEXT_FORMATS = [
     "ppt",
     "odp",
 ]
+# Set forms for membership checks; the lists above keep the display order.
+OUT_VIDEO_FORMATS_SET = frozenset(OUT_VIDEO_FORMATS)
+OUT_IMAGE_FORMATS_SET = frozenset(OUT_IMAGE_FORMATS)
+OUT_AUDIO_FORMATS_SET = frozenset(OUT_AUDIO_FORMATS)
+OUT_SUBTITLE_FORMATS_SET = frozenset(OUT_SUBTITLE_FORMATS)
+OUT_TEXT_FORMATS_SET = frozenset(OUT_TEXT_FORMATS)
 
 OPERATION_OPTIONS = [
     "Конвертація",
@@ -154,7 +196,18 @@ HW_ENCODER_MAP = {
     "AMD (AMF)": "amd",
 }
 
+# Encoder-availability summary: label shown when any of the encoders is present
+ENCODER_FAMILIES = (
+    ("NVENC", frozenset({"h264_nvenc", "hevc_nvenc", "av1_nvenc"})),
+    ("QSV", frozenset({"h264_qsv", "hevc_qsv", "av1_qsv"})),
+    ("AMF", frozenset({"h264_amf", "hevc_amf", "av1_amf"})),
+    ("x265", frozenset({"libx265"})),
+    ("AV1", frozenset({"libsvtav1", "libaom-av1"})),
+    ("VP9", frozenset({"libvpx-vp9"})),
+)
+
 ROTATE_OPTIONS = ["0", "90° вправо", "90° вліво", "180°"]
+ROTATE_OPTIONS_SET = frozenset(ROTATE_OPTIONS)
 ROTATE_MAP = {
     "0": None,
     "90° вправо": "transpose=1",
@@ -169,6 +222,7 @@ POSITION_OPTIONS = [
     "Низ-праворуч",
     "Центр",
 ]
+POSITION_OPTIONS_SET = frozenset(POSITION_OPTIONS)
 POSITION_MAP = {
     "Верх-ліворуч": "10:10",
     "Верх-праворуч": "W-w-10:10",
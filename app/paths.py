@@ -38,6 +38,7 @@ LOG_PATH = APP_DATA_DIR / "history.log"
 PRESET_PATH = APP_DATA_DIR / "presets.json"
 THEME_PATH = APP_DATA_DIR / "theme.json"
 HISTORY_PATH = APP_DATA_DIR / "history.json"
+ENCODER_CACHE_PATH = APP_DATA_DIR / "encoder_cache.json"
 DEFAULT_OUTPUT_DIR = Path.home() / "Videos" / "converted"
 
 
@@ -81,13 +82,43 @@ def find_ffmpeg() -> str | None:
     return _find_binary(exe, explicit)
 
 
+# Found ffprobe paths keyed by (ffmpeg path, ffmpeg st_mtime_ns, MEDIA_CONVERTER_FFPROBE).
+_FFPROBE_CACHE: dict[tuple[str, int, str], str] = {}
+_FFPROBE_CACHE_LIMIT = 8
+
+
 def find_ffprobe(ffmpeg_path: str | None) -> str | None:
+    """Locate ffprobe, reusing the last lookup for an unchanged ffmpeg binary.
+
+    Only found paths are cached, and a hit is re-checked with a single
+    ``isfile``; a miss always walks the search roots once, so a freshly
+    installed ffprobe is picked up immediately.
+    """
+    explicit = os.environ.get("MEDIA_CONVERTER_FFPROBE", "").strip()
+    try:
+        mtime_ns = os.stat(ffmpeg_path).st_mtime_ns if ffmpeg_path else 0
+    except OSError:
+        mtime_ns = -1
+    key = (ffmpeg_path or "", mtime_ns, explicit)
+    cached = _FFPROBE_CACHE.get(key)
+    if cached is not None:
+        if os.path.isfile(cached):
+            return cached
+        _FFPROBE_CACHE.pop(key, None)
+    resolved = _resolve_ffprobe(*key)
+    if resolved is not None:
+        if len(_FFPROBE_CACHE) >= _FFPROBE_CACHE_LIMIT:
+            _FFPROBE_CACHE.pop(next(iter(_FFPROBE_CACHE)), None)
+        _FFPROBE_CACHE[key] = resolved
+    return resolved
+
+
+def _resolve_ffprobe(ffmpeg_path: str, mtime_ns: int, explicit: str) -> str | None:
     exe = "ffprobe.exe" if os.name == "nt" else "ffprobe"
     candidates = []
     if ffmpeg_path:
         ffmpeg_dir = Path(ffmpeg_path).expanduser().resolve().parent
         candidates.append(ffmpeg_dir / exe)
-    explicit = os.environ.get("MEDIA_CONVERTER_FFPROBE", "").strip()
     if explicit:
         path = Path(explicit).expanduser()
         if path.exists() and path.is_file():
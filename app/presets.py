@@ -1,8 +1,7 @@
-﻿import json
-from pathlib import Path
+﻿from pathlib import Path
 from typing import Any
 
-from utils.state import save_json_file
+from utils.state import dumps_json, loads_json, write_text_atomic
 
 DEFAULT_PRESETS: dict[str, dict[str, Any]] = {
     "H.264 • Баланс (MP4)": {
@@ -198,23 +197,53 @@ DEFAULT_PRESETS: dict[str, dict[str, Any]] = {
 }
 
 
+# path -> ((st_mtime_ns, st_size), serialized text, merged presets) as last read or
+# written, so repeat loads and unchanged saves skip the disk entirely.
+_STORE_CACHE: dict[Path, tuple[tuple[int, int], str, dict[str, dict[str, Any]]]] = {}
+
+
+def _file_signature(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _copy_presets(presets: dict[str, dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    # Callers edit preset dicts in place; never share them with the cache or the defaults.
+    return {name: dict(data) if isinstance(data, dict) else data for name, data in presets.items()}
+
+
 def load_presets(path: Path) -> dict[str, dict[str, Any]]:
-    if not path.exists():
-        return dict(DEFAULT_PRESETS)
+    signature = _file_signature(path)
+    if signature is None:
+        return _copy_presets(DEFAULT_PRESETS)
+    cached = _STORE_CACHE.get(path)
+    if cached is not None and cached[0] == signature:
+        return _copy_presets(cached[2])
     try:
-        with path.open("r", encoding="utf-8") as fh:
-            data = json.load(fh)
-        if isinstance(data, dict):
-            merged = dict(DEFAULT_PRESETS)
-            merged.update(data)
-            return merged
-    except Exception:
-        return dict(DEFAULT_PRESETS)
-    return dict(DEFAULT_PRESETS)
+        text = path.read_text(encoding="utf-8")
+        data = loads_json(text)
+    except (OSError, UnicodeDecodeError, ValueError):
+        return _copy_presets(DEFAULT_PRESETS)
+    if not isinstance(data, dict):
+        return _copy_presets(DEFAULT_PRESETS)
+    merged = _copy_presets(DEFAULT_PRESETS)
+    merged.update(data)
+    _STORE_CACHE[path] = (signature, text, _copy_presets(merged))
+    return merged
 
 
 def save_presets(path: Path, presets: dict[str, dict[str, Any]]) -> None:
     try:
-        save_json_file(path, presets)
+        text = dumps_json(presets)
+        cached = _STORE_CACHE.get(path)
+        if cached is not None and cached[1] == text and cached[0] == _file_signature(path):
+            return
+        write_text_atomic(path, text)
     except Exception:
         return
+    signature = _file_signature(path)
+    if signature is not None:
+        _STORE_CACHE[path] = (signature, text, _copy_presets(presets))
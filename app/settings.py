@@ -5,13 +5,13 @@ from app.constants import (
     HW_ENCODER_MAP,
     HW_ENCODER_OPTIONS,
     OPERATION_MAP,
-    OUT_AUDIO_FORMATS,
-    OUT_IMAGE_FORMATS,
-    OUT_SUBTITLE_FORMATS,
-    OUT_TEXT_FORMATS,
-    OUT_VIDEO_FORMATS,
-    POSITION_OPTIONS,
-    ROTATE_OPTIONS,
+    OUT_AUDIO_FORMATS_SET,
+    OUT_IMAGE_FORMATS_SET,
+    OUT_SUBTITLE_FORMATS_SET,
+    OUT_TEXT_FORMATS_SET,
+    OUT_VIDEO_FORMATS_SET,
+    POSITION_OPTIONS_SET,
+    ROTATE_OPTIONS_SET,
     VIDEO_CODEC_MAP,
     VIDEO_CODEC_OPTIONS,
 )
@@ -157,15 +157,15 @@ def settings_map_to_model(settings_map: Mapping[str, Any], *, defaults: Conversi
     settings.operation = OPERATION_MAP.get(operation_label, operation_label or settings.operation)
 
     out_video_format = str(settings_map.get("out_video_fmt") or settings.out_video_format).strip().lower()
-    if out_video_format in OUT_VIDEO_FORMATS:
+    if out_video_format in OUT_VIDEO_FORMATS_SET:
         settings.out_video_format = out_video_format
 
     out_image_format = str(settings_map.get("out_image_fmt") or settings.out_image_format).strip().lower()
-    if out_image_format in OUT_IMAGE_FORMATS:
+    if out_image_format in OUT_IMAGE_FORMATS_SET:
         settings.out_image_format = out_image_format
 
     out_audio_format = str(settings_map.get("out_audio_fmt") or settings.out_audio_format).strip().lower()
-    if out_audio_format in OUT_AUDIO_FORMATS:
+    if out_audio_format in OUT_AUDIO_FORMATS_SET:
         settings.out_audio_format = out_audio_format
 
     out_subtitle_format = str(
@@ -173,12 +173,12 @@ def settings_map_to_model(settings_map: Mapping[str, Any], *, defaults: Conversi
         or settings_map.get("subtitle_out_fmt")
         or settings.out_subtitle_format
     ).strip().lower()
-    if out_subtitle_format in OUT_SUBTITLE_FORMATS:
+    if out_subtitle_format in OUT_SUBTITLE_FORMATS_SET:
         settings.out_subtitle_format = out_subtitle_format
         settings.subtitle_out_format = out_subtitle_format
 
     out_text_format = str(settings_map.get("out_text_fmt") or settings.out_text_format).strip().lower()
-    if out_text_format in OUT_TEXT_FORMATS:
+    if out_text_format in OUT_TEXT_FORMATS_SET:
         settings.out_text_format = out_text_format
 
     settings.audio_bitrate = str(settings_map.get("audio_bitrate") or settings.audio_bitrate).strip() or settings.audio_bitrate
@@ -248,7 +248,7 @@ def settings_map_to_model(settings_map: Mapping[str, Any], *, defaults: Conversi
     settings.crop_x = parse_int(str(settings_map.get("crop_x", "")))
     settings.crop_y = parse_int(str(settings_map.get("crop_y", "")))
     rotate = settings_map.get("rotate") or settings.rotate
-    if rotate in ROTATE_OPTIONS:
+    if isinstance(rotate, str) and rotate in ROTATE_OPTIONS_SET:
         settings.rotate = rotate
 
     speed = parse_float(str(settings_map.get("speed", "")))
@@ -269,7 +269,7 @@ def settings_map_to_model(settings_map: Mapping[str, Any], *, defaults: Conversi
     settings.subtitle_shadow = _coerce_int(settings_map.get("subtitle_shadow"), settings.subtitle_shadow, minimum=0, maximum=20)
     settings.subtitle_alignment = _coerce_int(settings_map.get("subtitle_alignment"), settings.subtitle_alignment, minimum=1, maximum=9)
     subtitle_out_format = str(settings_map.get("subtitle_out_fmt") or settings.subtitle_out_format).strip().lower()
-    if subtitle_out_format in OUT_SUBTITLE_FORMATS:
+    if subtitle_out_format in OUT_SUBTITLE_FORMATS_SET:
         settings.subtitle_out_format = subtitle_out_format
         settings.out_subtitle_format = subtitle_out_format
 
@@ -281,14 +281,14 @@ def settings_map_to_model(settings_map: Mapping[str, Any], *, defaults: Conversi
 
     settings.watermark_path = str(settings_map.get("wm_path", settings.watermark_path))
     wm_pos = settings_map.get("wm_pos") or settings.watermark_pos
-    if wm_pos in POSITION_OPTIONS:
+    if isinstance(wm_pos, str) and wm_pos in POSITION_OPTIONS_SET:
         settings.watermark_pos = wm_pos
     settings.watermark_opacity = _coerce_int(settings_map.get("wm_opacity"), settings.watermark_opacity, minimum=0, maximum=100)
     settings.watermark_scale = _coerce_int(settings_map.get("wm_scale"), settings.watermark_scale, minimum=1, maximum=100)
 
     settings.text_wm = str(settings_map.get("text_wm", settings.text_wm))
     text_pos = settings_map.get("text_pos") or settings.text_pos
-    if text_pos in POSITION_OPTIONS:
+    if isinstance(text_pos, str) and text_pos in POSITION_OPTIONS_SET:
         settings.text_pos = text_pos
     settings.text_size = _coerce_int(settings_map.get("text_size"), settings.text_size, minimum=1)
     settings.text_color = str(settings_map.get("text_color") or settings.text_color)
@@ -42,6 +42,7 @@ def main() -> None:
     engine = QtQml.QQmlApplicationEngine()
     engine.addImportPath(str(qml_dir))
     backend = Backend()
+    app.aboutToQuit.connect(backend.shutdown)
     engine.rootContext().setContextProperty("backend", backend)
     engine.load(QtCore.QUrl.fromLocalFile(str(main_qml)))
 
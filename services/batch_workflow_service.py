@@ -7,7 +7,13 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-from app.constants import OUT_AUDIO_FORMATS, OUT_IMAGE_FORMATS, OUT_SUBTITLE_FORMATS, OUT_TEXT_FORMATS, OUT_VIDEO_FORMATS
+from app.constants import (
+    OUT_AUDIO_FORMATS_SET,
+    OUT_IMAGE_FORMATS_SET,
+    OUT_SUBTITLE_FORMATS_SET,
+    OUT_TEXT_FORMATS_SET,
+    OUT_VIDEO_FORMATS_SET,
+)
 from app.models import TaskItem
 
 DEFAULT_FOLDER_RULES = "Downloads -> mp4\nCamera -> h265\nAudio -> mp3"
@@ -162,15 +168,15 @@ class BatchWorkflowService:
 
     def _apply_format(self, value: str, overrides: dict[str, Any]) -> None:
         normalized = str(value or "").strip().lower().lstrip(".")
-        if normalized in OUT_VIDEO_FORMATS:
+        if normalized in OUT_VIDEO_FORMATS_SET:
             overrides["out_video_fmt"] = normalized
-        elif normalized in OUT_AUDIO_FORMATS:
+        elif normalized in OUT_AUDIO_FORMATS_SET:
             overrides["out_audio_fmt"] = normalized
-        elif normalized in OUT_IMAGE_FORMATS:
+        elif normalized in OUT_IMAGE_FORMATS_SET:
             overrides["out_image_fmt"] = normalized
-        elif normalized in OUT_SUBTITLE_FORMATS:
+        elif normalized in OUT_SUBTITLE_FORMATS_SET:
             overrides["out_subtitle_fmt"] = normalized
-        elif normalized in OUT_TEXT_FORMATS:
+        elif normalized in OUT_TEXT_FORMATS_SET:
             overrides["out_text_fmt"] = normalized
 
     def _media_overrides(self, overrides: dict[str, Any], media_type: str) -> dict[str, Any]:
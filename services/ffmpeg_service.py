@@ -10,7 +10,9 @@ from typing import Any
 
 from app.constants import HW_ENCODER_MAP, PORTRAIT_PRESETS, POSITION_MAP, VIDEO_CODEC_MAP
 from app.models import ConversionSettings, MediaChapter, MediaInfo
+from app.paths import ENCODER_CACHE_PATH
 from utils.formatting import build_atempo_chain
+from utils.state import load_json_file, save_json_file
 
 
 def escape_drawtext(text: str) -> str:
@@ -189,6 +191,32 @@ class FfmpegService:
                 encoders.add(parts[1])
         return encoders
 
+    def detect_encoders_cached(self, cache_path: Path = ENCODER_CACHE_PATH) -> set[str]:
+        """Like detect_encoders, but reuse the last result while the binary's size and mtime are unchanged."""
+        if not self.ffmpeg_path:
+            return set()
+        try:
+            stat = Path(self.ffmpeg_path).stat()
+        except OSError:
+            return self.detect_encoders()
+        key = str(self.ffmpeg_path)
+        data = load_json_file(cache_path)
+        entries = data if isinstance(data, dict) else {}
+        entry = entries.get(key)
+        if (
+            isinstance(entry, dict)
+            and entry.get("size") == stat.st_size
+            and entry.get("mtime_ns") == stat.st_mtime_ns
+            and isinstance(entry.get("encoders"), list)
+        ):
+            return {str(name) for name in entry["encoders"]}
+        encoders = self.detect_encoders()
+        if encoders:
+            entries[key] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "encoders": sorted(encoders)}
+            with contextlib.suppress(OSError):
+                save_json_file(cache_path, entries)
+        return encoders
+
     def probe_duration_ms(self, path: Path) -> float | None:
         if not self.ffprobe_path:
             return None
@@ -202,7 +230,13 @@ class FfmpegService:
             str(path),
         ]
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=self.PROBE_TIMEOUT_SEC)
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                text=True,
+                timeout=self.PROBE_TIMEOUT_SEC,
+                creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
+            )
         except Exception:
             return None
         if result.returncode != 0:
@@ -245,7 +279,13 @@ class FfmpegService:
             str(path),
         ]
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=self.PROBE_TIMEOUT_SEC)
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                text=True,
+                timeout=self.PROBE_TIMEOUT_SEC,
+                creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
+            )
         except Exception:
             return None
         if result.returncode != 0:
@@ -100,19 +100,7 @@ class FolderScanner:
                     excluded_count += 1
                     continue
 
-                # Size check
-                try:
-                    size = item.stat().st_size
-                except OSError:
-                    continue
-                if self.min_size_bytes and size < self.min_size_bytes:
-                    size_filtered_count += 1
-                    continue
-                if self.max_size_bytes and size > self.max_size_bytes:
-                    size_filtered_count += 1
-                    continue
-
-                # Type filter
+                # Type filter (suffix only, so it runs before any stat)
                 kind = media_type(item)
                 if not kind:
                     excluded_count += 1
@@ -121,6 +109,19 @@ class FolderScanner:
                     type_filtered_count += 1
                     continue
 
+                # Size check
+                if self.min_size_bytes or self.max_size_bytes:
+                    try:
+                        size = item.stat().st_size
+                    except OSError:
+                        continue
+                    if self.min_size_bytes and size < self.min_size_bytes:
+                        size_filtered_count += 1
+                        continue
+                    if self.max_size_bytes and size > self.max_size_bytes:
+                        size_filtered_count += 1
+                        continue
+
                 all_files.append(item)
         except PermissionError:
             pass
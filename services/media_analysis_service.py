@@ -6,15 +6,34 @@ from pathlib import Path
 
 from app.models import MediaInfo
 from services.ffmpeg_service import FfmpegService
+from services.media_info_cache import MediaInfoCache
 
 
 class MediaAnalysisService:
-    def __init__(self, ffmpeg: FfmpegService, cache_dir: Path | None = None) -> None:
+    def __init__(self, ffmpeg: FfmpegService, cache_dir: Path | None = None, info_cache: MediaInfoCache | None = None) -> None:
         self.ffmpeg = ffmpeg
         self.cache_dir = cache_dir or (Path.home() / ".media_converter_gui_thumbnails")
+        self.info_cache = info_cache
 
     def probe(self, path: Path) -> MediaInfo | None:
-        return self.ffmpeg.probe_media(path)
+        if self.info_cache is not None:
+            cached = self.info_cache.get(path)
+            if cached is not None:
+                return cached
+        info = self.ffmpeg.probe_media(path)
+        if info is not None and self.info_cache is not None:
+            self.info_cache.put(path, info)
+        return info
+
+    def cached_probe(self, path: Path) -> MediaInfo | None:
+        """Return a persisted probe result without spawning ffprobe."""
+        if self.info_cache is None:
+            return None
+        return self.info_cache.get(path)
+
+    def save_cache(self) -> None:
+        if self.info_cache is not None:
+            self.info_cache.save()
 
     def thumbnail_for(self, path: Path, media_kind: str) -> str | None:
         if media_kind == "image" and path.exists():
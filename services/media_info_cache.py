@@ -0,0 +1,107 @@
+"""Persistent ffprobe result cache.
+
+Entries are keyed by the source path and invalidated when the file's
+``st_mtime_ns`` or ``st_size`` changes, so re-adding the same files after a
+restart skips the ffprobe subprocess entirely.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any
+
+from app.models import MediaChapter, MediaInfo
+from app.paths import APP_DATA_DIR
+from utils.state import load_json_file, save_json_file
+
+MEDIA_INFO_CACHE_PATH = APP_DATA_DIR / "media_info_cache.json"
+MEDIA_INFO_CACHE_LIMIT = 2000
+
+
+def media_info_to_dict(info: MediaInfo) -> dict[str, Any]:
+    return asdict(info)
+
+
+def media_info_from_dict(data: dict[str, Any]) -> MediaInfo | None:
+    try:
+        payload = dict(data)
+        chapters = [MediaChapter(**chapter) for chapter in payload.pop("chapters", []) or []]
+        warnings = [str(item) for item in payload.pop("warnings", []) or []]
+        return MediaInfo(**payload, chapters=chapters, warnings=warnings)
+    except (TypeError, ValueError):
+        return None
+
+
+def _file_signature(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class MediaInfoCache:
+    """LRU of probe results persisted as JSON; safe to use from worker threads."""
+
+    def __init__(self, path: Path = MEDIA_INFO_CACHE_PATH, limit: int = MEDIA_INFO_CACHE_LIMIT) -> None:
+        self.path = path
+        self.limit = max(1, int(limit))
+        self._entries: OrderedDict[str, dict[str, Any]] | None = None
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def _load(self) -> OrderedDict[str, dict[str, Any]]:
+        if self._entries is None:
+            data = load_json_file(self.path)
+            entries = data.get("entries") if isinstance(data, dict) else None
+            self._entries = OrderedDict(
+                (str(key), value) for key, value in (entries or {}).items() if isinstance(value, dict)
+            )
+        return self._entries
+
+    def get(self, path: Path) -> MediaInfo | None:
+        signature = _file_signature(path)
+        if signature is None:
+            return None
+        key = str(path)
+        with self._lock:
+            entries = self._load()
+            entry = entries.get(key)
+            if entry is None:
+                return None
+            if (entry.get("mtime_ns"), entry.get("size")) != signature:
+                del entries[key]
+                self._dirty = True
+                return None
+            entries.move_to_end(key)
+        info = entry.get("info")
+        return media_info_from_dict(info) if isinstance(info, dict) else None
+
+    def put(self, path: Path, info: MediaInfo) -> None:
+        signature = _file_signature(path)
+        if signature is None:
+            return
+        key = str(path)
+        with self._lock:
+            entries = self._load()
+            entries[key] = {"mtime_ns": signature[0], "size": signature[1], "info": media_info_to_dict(info)}
+            entries.move_to_end(key)
+            while len(entries) > self.limit:
+                entries.popitem(last=False)
+            self._dirty = True
+
+    def save(self) -> None:
+        with self._lock:
+            if not self._dirty or self._entries is None:
+                return
+            payload = {"version": 1, "entries": dict(self._entries)}
+            self._dirty = False
+        try:
+            save_json_file(self.path, payload)
+        except OSError:
+            # Keep the entries pending so a later save() can still persist them.
+            with self._lock:
+                self._dirty = True
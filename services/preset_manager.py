@@ -1,5 +1,6 @@
 ﻿from __future__ import annotations
 
+import threading
 from pathlib import Path
 from typing import Any
 
@@ -11,6 +12,7 @@ class PresetManager:
     def __init__(self, path: Path = PRESET_STORE) -> None:
         self.path = path
         self.presets: dict[str, dict[str, Any]] = load_presets(path)
+        self._write_lock = threading.Lock()
 
     def names(self) -> list[str]:
         return sorted(self.presets.keys())
@@ -19,13 +21,23 @@ class PresetManager:
         data = self.presets.get(name)
         return dict(data) if isinstance(data, dict) else None
 
-    def save(self, name: str, settings_map: dict[str, Any]) -> None:
+    def save(self, name: str, settings_map: dict[str, Any], *, persist: bool = True) -> None:
         self.presets[name] = dict(settings_map)
-        save_presets(self.path, self.presets)
+        if persist:
+            self.persist()
 
-    def delete(self, name: str) -> bool:
+    def delete(self, name: str, *, persist: bool = True) -> bool:
         if name not in self.presets:
             return False
         del self.presets[name]
-        save_presets(self.path, self.presets)
+        if persist:
+            self.persist()
         return True
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        return {name: dict(data) for name, data in self.presets.items()}
+
+    def persist(self, snapshot: dict[str, dict[str, Any]] | None = None) -> None:
+        """Write the store; pass a ``snapshot`` when calling from a worker thread."""
+        with self._write_lock:
+            save_presets(self.path, self.presets if snapshot is None else snapshot)
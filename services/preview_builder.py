@@ -10,7 +10,7 @@ from app.settings import merge_settings_maps, settings_map_to_model
 from services.ffmpeg_service import FfmpegService
 from services.smart_convert_service import apply_smart_settings
 from services.validation_service import OPERATION_LABELS, operation_supports_media
-from utils.files import build_merge_output_path, build_output_path
+from utils.files import NameAllocator, build_merge_output_path, build_output_path
 
 
 class PreviewBuilder:
@@ -37,6 +37,8 @@ class PreviewBuilder:
         selected = Path(selected_path).expanduser() if selected_path else None
         selected_item: PreviewItem | None = None
         base_settings = settings_map_to_model(settings_map, defaults=ConversionSettings())
+        # One listing of the output folder serves every collision check in this pass.
+        allocator = NameAllocator()
         resolved_by_path: dict[Path, ConversionSettings] = {}
         for task in tasks:
             merged_map = merge_settings_maps(settings_map, task.overrides)
@@ -72,6 +74,7 @@ class PreviewBuilder:
                 base_settings.out_video_format,
                 overwrite=base_settings.overwrite,
                 skip_existing=base_settings.skip_existing,
+                allocator=allocator,
             )
             merge_command = self.build_merge_command(merge_candidates, base_settings, merge_preview_path, info_cache)
 
@@ -107,6 +110,7 @@ class PreviewBuilder:
                     media_type_name=task.media_type,
                     overwrite=resolved.overwrite,
                     skip_existing=resolved.skip_existing,
+                    allocator=allocator,
                 )
                 warnings = self._warnings_for(task, resolved, desired_path, preview_path)
                 command = self.build_command(task, resolved, preview_path, info_cache)
@@ -6,6 +6,7 @@ from typing import Any
 
 from app.models import TASK_STATUSES, TaskItem, TaskStatus
 from utils.files import file_sha256, media_type
+from utils.formatting import format_bytes
 
 
 class QueueManager:
@@ -105,6 +106,13 @@ class QueueManager:
             existing_paths.add(resolved)
         return added, duplicate_count, unsupported_count
 
+    def fill_file_sizes(self, items: Iterable[TaskItem]) -> None:
+        for item in items:
+            try:
+                item.size_text = format_bytes(item.path.stat().st_size)
+            except OSError:
+                item.size_text = "—"
+
     def deduplicate_by_path(self, items: Sequence[TaskItem]) -> tuple[list[TaskItem], int]:
         seen: set[Path] = set()
         unique: list[TaskItem] = []
@@ -176,37 +184,6 @@ class QueueManager:
             result = rest + moved
         return result
 
-    def remove_indices(self, items: Sequence[TaskItem], indices: Iterable[int]) -> tuple[list[TaskItem], int]:
-        selected = {idx for idx in indices if 0 <= idx < len(items)}
-        if not selected:
-            return list(items), 0
-        return [item for idx, item in enumerate(items) if idx not in selected], len(selected)
-
-    def remove_paths(self, items: Sequence[TaskItem], paths: Iterable[Path]) -> tuple[list[TaskItem], int]:
-        selected = {path.expanduser() for path in paths}
-        removed = 0
-        kept: list[TaskItem] = []
-        for item in items:
-            if item.path in selected:
-                removed += 1
-            else:
-                kept.append(item)
-        return kept, removed
-
     def selected_indices_for_paths(self, items: Sequence[TaskItem], paths: Iterable[Path]) -> list[int]:
         selected = {path.expanduser() for path in paths}
         return [idx for idx, item in enumerate(items) if item.path in selected]
-
-    def move_path_to_index(self, items: Sequence[TaskItem], path: Path, target_index: int) -> list[TaskItem]:
-        result = list(items)
-        source_index: int | None = None
-        for idx, item in enumerate(result):
-            if item.path == path.expanduser():
-                source_index = idx
-                break
-        if source_index is None:
-            return result
-        item = result.pop(source_index)
-        target = max(0, min(target_index, len(result)))
-        result.insert(target, item)
-        return result
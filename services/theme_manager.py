@@ -11,7 +11,9 @@ Supports:
 from __future__ import annotations
 
 import sys
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 from app.paths import APP_DATA_DIR
@@ -19,22 +21,25 @@ from utils.state import load_json_state, save_json_state
 
 THEME_STATE_PATH = APP_DATA_DIR / "theme_config.json"
 
-# Pre-defined accent color palettes
-ACCENT_PRESETS: list[dict[str, str]] = [
-    {"name": "Blue", "color": "#2563EB"},
-    {"name": "Purple", "color": "#7C3AED"},
-    {"name": "Teal", "color": "#0F766E"},
-    {"name": "Rose", "color": "#E11D48"},
-    {"name": "Amber", "color": "#D97706"},
-    {"name": "Emerald", "color": "#15803D"},
-    {"name": "Cyan", "color": "#0891B2"},
-    {"name": "Indigo", "color": "#4F46E5"},
-    {"name": "Pink", "color": "#DB2777"},
-    {"name": "Orange", "color": "#EA580C"},
-]
+# Pre-defined accent color palettes (read-only; accessors hand out copies)
+ACCENT_PRESETS: tuple[Mapping[str, str], ...] = tuple(
+    MappingProxyType(preset)
+    for preset in (
+        {"name": "Blue", "color": "#2563EB"},
+        {"name": "Purple", "color": "#7C3AED"},
+        {"name": "Teal", "color": "#0F766E"},
+        {"name": "Rose", "color": "#E11D48"},
+        {"name": "Amber", "color": "#D97706"},
+        {"name": "Emerald", "color": "#15803D"},
+        {"name": "Cyan", "color": "#0891B2"},
+        {"name": "Indigo", "color": "#4F46E5"},
+        {"name": "Pink", "color": "#DB2777"},
+        {"name": "Orange", "color": "#EA580C"},
+    )
+)
 
 # Layout mode definitions
-LAYOUT_MODES = {
+_LAYOUT_MODES = {
     "compact": {
         "font_scale": 0.85,
         "spacing_scale": 0.75,
@@ -54,38 +59,50 @@ LAYOUT_MODES = {
         "card_padding": 16,
     },
 }
+LAYOUT_MODES: Mapping[str, Mapping[str, Any]] = MappingProxyType(
+    {name: MappingProxyType(config) for name, config in _LAYOUT_MODES.items()}
+)
 
 
 class ThemeManager:
-    """Manages UI theming, layout, and window state persistence."""
+    """Manages UI theming, layout, and window state persistence.
 
-    def __init__(self, path: Path = THEME_STATE_PATH) -> None:
+    Setters return whether the value changed; re-applying the current value
+    neither rewrites the state file nor asks the UI to re-theme. With
+    ``autosave=False`` changes are only marked dirty and written by ``flush``.
+    """
+
+    # The OS probe can spawn a subprocess, so it runs once per session unless refreshed.
+    _os_dark_mode: bool | None = None
+
+    def __init__(self, path: Path = THEME_STATE_PATH, *, autosave: bool = True) -> None:
         self.path = path
+        self.autosave = autosave
         self._state = load_json_state(path)
+        self._dirty = False
 
     def accent_color(self) -> str:
         return str(self._state.get("accent_color") or "#2563EB")
 
-    def set_accent_color(self, color: str) -> None:
-        self._state["accent_color"] = str(color or "#2563EB")
-        self._save()
+    def set_accent_color(self, color: str) -> bool:
+        return self._update("accent_color", str(color or "#2563EB"))
 
     def theme_mode(self) -> str:
         """Return 'dark', 'light', 'auto', or 'high_contrast'."""
         return str(self._state.get("theme_mode") or "light")
 
-    def set_theme_mode(self, mode: str) -> None:
+    def set_theme_mode(self, mode: str) -> bool:
         normalized = "auto" if mode == "system" else str(mode or "light")
-        self._state["theme_mode"] = normalized if normalized in ("dark", "light", "auto", "high_contrast") else "light"
-        self._save()
+        return self._update(
+            "theme_mode", normalized if normalized in ("dark", "light", "auto", "high_contrast") else "light"
+        )
 
     def layout_mode(self) -> str:
         """Return 'compact', 'comfortable', or 'spacious'."""
         return str(self._state.get("layout_mode") or "comfortable")
 
-    def set_layout_mode(self, mode: str) -> None:
-        self._state["layout_mode"] = mode if mode in LAYOUT_MODES else "comfortable"
-        self._save()
+    def set_layout_mode(self, mode: str) -> bool:
+        return self._update("layout_mode", mode if mode in LAYOUT_MODES else "comfortable")
 
     def layout_config(self) -> dict[str, Any]:
         """Return the current layout configuration dict."""
@@ -97,43 +114,42 @@ class ThemeManager:
         scale = self._state.get("font_scale")
         if scale is not None:
             return max(0.7, min(float(scale), 1.5))
-        return self.layout_config().get("font_scale", 1.0)
+        return LAYOUT_MODES.get(self.layout_mode(), LAYOUT_MODES["comfortable"]).get("font_scale", 1.0)
 
-    def set_font_scale(self, scale: float) -> None:
-        self._state["font_scale"] = max(0.7, min(float(scale), 1.5))
-        self._save()
+    def set_font_scale(self, scale: float) -> bool:
+        return self._update("font_scale", max(0.7, min(float(scale), 1.5)))
 
     def window_state(self) -> dict[str, int]:
         """Return saved window geometry: {x, y, width, height}."""
         return dict(self._state.get("window_state") or {})
 
-    def set_window_state(self, x: int, y: int, width: int, height: int) -> None:
-        self._state["window_state"] = {
-            "x": int(x),
-            "y": int(y),
-            "width": max(800, int(width)),
-            "height": max(600, int(height)),
-        }
-        self._save()
+    def set_window_state(self, x: int, y: int, width: int, height: int) -> bool:
+        return self._update(
+            "window_state",
+            {
+                "x": int(x),
+                "y": int(y),
+                "width": max(800, int(width)),
+                "height": max(600, int(height)),
+            },
+        )
 
     def sidebar_collapsed(self) -> bool:
         return bool(self._state.get("sidebar_collapsed", False))
 
-    def set_sidebar_collapsed(self, collapsed: bool) -> None:
-        self._state["sidebar_collapsed"] = bool(collapsed)
-        self._save()
+    def set_sidebar_collapsed(self, collapsed: bool) -> bool:
+        return self._update("sidebar_collapsed", bool(collapsed))
 
     def beginner_mode(self) -> bool:
         """Return whether beginner mode (simplified UI) is active."""
         return bool(self._state.get("beginner_mode", False))
 
-    def set_beginner_mode(self, enabled: bool) -> None:
-        self._state["beginner_mode"] = bool(enabled)
-        self._save()
+    def set_beginner_mode(self, enabled: bool) -> bool:
+        return self._update("beginner_mode", bool(enabled))
 
     def accent_presets(self) -> list[dict[str, str]]:
         """Return list of accent color presets."""
-        return list(ACCENT_PRESETS)
+        return [dict(preset) for preset in ACCENT_PRESETS]
 
     def export_theme(self) -> dict[str, Any]:
         """Export current theme configuration."""
@@ -146,26 +162,54 @@ class ThemeManager:
             "beginner_mode": self.beginner_mode(),
         }
 
-    def import_theme(self, data: dict[str, Any]) -> None:
-        """Import theme configuration from a dict."""
+    def import_theme(self, data: dict[str, Any]) -> bool:
+        """Import theme configuration from a dict; return whether anything changed."""
         if not isinstance(data, dict):
-            return
+            return False
+        changed = False
         if "accent_color" in data:
-            self.set_accent_color(str(data["accent_color"]))
+            changed |= self.set_accent_color(str(data["accent_color"]))
         if "theme_mode" in data:
-            self.set_theme_mode(str(data["theme_mode"]))
+            changed |= self.set_theme_mode(str(data["theme_mode"]))
         if "layout_mode" in data:
-            self.set_layout_mode(str(data["layout_mode"]))
+            changed |= self.set_layout_mode(str(data["layout_mode"]))
         if "font_scale" in data:
-            self.set_font_scale(float(data["font_scale"]))
+            changed |= self.set_font_scale(float(data["font_scale"]))
         if "beginner_mode" in data:
-            self.set_beginner_mode(bool(data["beginner_mode"]))
+            changed |= self.set_beginner_mode(bool(data["beginner_mode"]))
+        return changed
+
+    def _update(self, key: str, value: Any) -> bool:
+        if key in self._state and self._state[key] == value:
+            return False
+        self._state[key] = value
+        self._dirty = True
+        if self.autosave:
+            self.flush()
+        return True
+
+    @property
+    def dirty(self) -> bool:
+        return self._dirty
+
+    def flush(self) -> None:
+        """Write pending changes, if any."""
+        if self._dirty:
+            self._save()
+            self._dirty = False
 
     def _save(self) -> None:
         save_json_state(self.path, self._state)
 
+    @classmethod
+    def detect_os_dark_mode(cls, refresh: bool = False) -> bool:
+        """Return True if the OS is in dark mode; cached unless ``refresh`` is set."""
+        if refresh or cls._os_dark_mode is None:
+            cls._os_dark_mode = cls._probe_os_dark_mode()
+        return cls._os_dark_mode
+
     @staticmethod
-    def detect_os_dark_mode() -> bool:
+    def _probe_os_dark_mode() -> bool:
         """Detect if the OS is in dark mode. Returns True for dark, False for light."""
         if sys.platform == "win32":
             try:
@@ -1,11 +1,18 @@
 ﻿from __future__ import annotations
 
+import os
 import shutil
 from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 
-from app.constants import OUT_AUDIO_FORMATS, OUT_IMAGE_FORMATS, OUT_SUBTITLE_FORMATS, OUT_TEXT_FORMATS, OUT_VIDEO_FORMATS
+from app.constants import (
+    OUT_AUDIO_FORMATS_SET,
+    OUT_IMAGE_FORMATS_SET,
+    OUT_SUBTITLE_FORMATS_SET,
+    OUT_TEXT_FORMATS_SET,
+    OUT_VIDEO_FORMATS_SET,
+)
 from app.models import ConversionSettings, TaskItem
 from app.paths import find_ffprobe
 from app.settings import merge_settings_maps, settings_map_to_model
@@ -36,9 +43,21 @@ def operation_supports_media(operation: str, media_type_name: str) -> bool:
     return False
 
 
+ASSET_PATH_FIELDS = {
+    "wm_path": "Водяний знак",
+    "cover_art_path": "Cover art",
+    "text_font": "Шрифт",
+    "subtitle_path": "Субтитри",
+    "replace_audio_path": "Аудіо для заміни",
+}
+
+
 class ValidationService:
     def __init__(self, ffmpeg: FfmpegService) -> None:
         self.ffmpeg = ffmpeg
+        # Draft validation runs on every settings edit; remember asset-path lookups
+        # by their literal text until that text changes or a full preflight runs.
+        self._asset_exists_cache: dict[str, bool] = {}
 
     def validate(
         self,
@@ -61,7 +80,7 @@ class ValidationService:
             if message not in warnings:
                 warnings.append(message)
 
-        self._validate_fields(raw, add_error)
+        self._validate_fields(raw, add_error, refresh_paths=include_queue)
 
         output_text = str(output_dir or "").strip()
         output_path = Path(output_text).expanduser() if output_text else Path.cwd()
@@ -96,12 +115,13 @@ class ValidationService:
             )
             if needs_ffmpeg:
                 self._validate_ffmpeg(ffmpeg_path, add_error, add_warning)
-            self._validate_queue(queue_items, raw, settings, output_path, add_error, add_warning)
+            source_sizes = self._source_sizes(queue_items)
+            self._validate_queue(queue_items, raw, settings, output_path, add_error, add_warning, source_sizes=source_sizes)
 
         self._validate_format_compat(raw, add_warning)
 
         if include_queue and output_path.exists():
-            self._validate_disk_space(queue_items, settings, output_path, add_error, add_warning)
+            self._validate_disk_space(queue_items, settings, output_path, add_error, add_warning, source_sizes=source_sizes)
 
         summary_bits = []
         if errors:
@@ -111,7 +131,7 @@ class ValidationService:
         summary = " | ".join(summary_bits) if summary_bits else "Перевірка пройдена."
         return {"ok": not errors, "errors": errors, "warnings": warnings, "summary": summary}
 
-    def _validate_fields(self, raw: dict[str, Any], add_error) -> None:
+    def _validate_fields(self, raw: dict[str, Any], add_error, *, refresh_paths: bool = False) -> None:
         positive_int_fields = {
             "resize_w": "Ширина resize",
             "resize_h": "Висота resize",
@@ -159,16 +179,21 @@ class ValidationService:
             if value and parse_float(value) is None:
                 add_error(field, f"{label}: очікується число.")
 
-        for field, label in {
-            "wm_path": "Водяний знак",
-            "cover_art_path": "Cover art",
-            "text_font": "Шрифт",
-            "subtitle_path": "Субтитри",
-            "replace_audio_path": "Аудіо для заміни",
-        }.items():
+        previous = {} if refresh_paths else self._asset_exists_cache
+        checked: dict[str, bool] = {}
+        for field, label in ASSET_PATH_FIELDS.items():
             value = str(raw.get(field, "")).strip()
-            if value and not Path(value).expanduser().exists():
+            if not value:
+                continue
+            exists = checked.get(value)
+            if exists is None:
+                exists = previous.get(value)
+                if exists is None:
+                    exists = os.path.exists(os.path.expanduser(value))
+                checked[value] = exists
+            if not exists:
                 add_error(field, f"{label}: файл не знайдено.")
+        self._asset_exists_cache = checked
 
         subtitle_path = str(raw.get("subtitle_path", "")).strip()
         if subtitle_path and not is_subtitle(Path(subtitle_path).expanduser()):
@@ -193,7 +218,11 @@ class ValidationService:
         output_dir: Path,
         add_error,
         add_warning,
+        *,
+        source_sizes: dict[Path, int | None] | None = None,
     ) -> None:
+        if source_sizes is None:
+            source_sizes = self._source_sizes(queue_items)
         unsupported = [item for item in queue_items if not operation_supports_media(settings.operation, item.media_type)]
         if unsupported:
             label = OPERATION_LABELS.get(settings.operation, settings.operation)
@@ -202,7 +231,7 @@ class ValidationService:
                 f"Операція '{label}' не підтримує частину файлів у черзі: {len(unsupported)}.",
             )
         for item in queue_items:
-            if not item.path.exists():
+            if source_sizes.get(item.path) is None:
                 add_error("queue", f"Файл не знайдено: {item.path}")
                 break
 
@@ -275,6 +304,17 @@ class ValidationService:
                 else:
                     add_warning(f"{desired.name}: є конфлікт імені, буде створено безпечну назву.")
 
+    @staticmethod
+    def _source_sizes(queue_items: list[TaskItem]) -> dict[Path, int | None]:
+        """Stat every queued source once; ``None`` marks a missing or unreadable file."""
+        sizes: dict[Path, int | None] = {}
+        for item in queue_items:
+            try:
+                sizes[item.path] = item.path.stat().st_size
+            except OSError:
+                sizes[item.path] = None
+        return sizes
+
     def _validate_format_compat(self, raw: dict[str, Any], add_warning) -> None:
         out_video = str(raw.get("out_video_fmt", "")).strip().lower()
         out_image = str(raw.get("out_image_fmt", "")).strip().lower()
@@ -283,15 +323,15 @@ class ValidationService:
         out_text = str(raw.get("out_text_fmt", "")).strip().lower()
         codec = str(raw.get("codec", "")).strip()
 
-        if out_video and out_video not in OUT_VIDEO_FORMATS:
+        if out_video and out_video not in OUT_VIDEO_FORMATS_SET:
             add_warning(f"Відеоформат '{out_video}' не входить до стандартного списку.")
-        if out_image and out_image not in OUT_IMAGE_FORMATS:
+        if out_image and out_image not in OUT_IMAGE_FORMATS_SET:
             add_warning(f"Формат зображень '{out_image}' не входить до стандартного списку.")
-        if out_audio and out_audio not in OUT_AUDIO_FORMATS:
+        if out_audio and out_audio not in OUT_AUDIO_FORMATS_SET:
             add_warning(f"Аудіоформат '{out_audio}' не входить до стандартного списку.")
-        if out_subtitle and out_subtitle not in OUT_SUBTITLE_FORMATS:
+        if out_subtitle and out_subtitle not in OUT_SUBTITLE_FORMATS_SET:
             add_warning(f"Формат субтитрів '{out_subtitle}' не входить до стандартного списку.")
-        if out_text and out_text not in OUT_TEXT_FORMATS:
+        if out_text and out_text not in OUT_TEXT_FORMATS_SET:
             add_warning(f"Текстовий формат '{out_text}' не входить до стандартного списку.")
         if out_video == "webm" and codec in {"H.264 (AVC)", "H.265 (HEVC)"}:
             add_warning("WebM не сумісний з H.264/H.265; буде використано VP9 або AV1.")
@@ -305,15 +345,20 @@ class ValidationService:
         output_dir: Path,
         add_error,
         add_warning,
+        *,
+        source_sizes: dict[Path, int | None] | None = None,
     ) -> None:
+        if source_sizes is None:
+            source_sizes = self._source_sizes(queue_items)
         try:
-            source_size = sum(item.path.stat().st_size for item in queue_items if item.path.exists())
+            known_sizes = [size for size in source_sizes.values() if size is not None]
+            source_size = sum(known_sizes)
             free = shutil.disk_usage(output_dir).free
             if not source_size:
                 return
             target_bytes = int(settings.target_size_mb * 1024 * 1024) if settings.target_size_mb else 0
             estimated_outputs = target_bytes * len(queue_items) if target_bytes else source_size
-            largest_output = target_bytes or max(item.path.stat().st_size for item in queue_items if item.path.exists())
+            largest_output = target_bytes or max(known_sizes)
             temporary_bytes = largest_output
             if settings.smart_ab_test:
                 temporary_bytes += largest_output * 3
@@ -0,0 +1,40 @@
+import os
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from PySide6.QtWidgets import QApplication
+
+from ui.backend import Backend
+
+
+class BackendEventDispatchTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        cls._app = QApplication.instance() or QApplication([])
+
+    def test_converter_events_match_handler_arity(self):
+        backend = Backend()
+        path = Path("/tmp/clip.mov")
+        events = [
+            ("status", "Обробка: clip.mov"),
+            ("set_total", 1, 12.5),
+            ("log", "INFO", "started"),
+            ("progress", 0.5, 6.0, 12.5, 6.0, 0.5, 6.0, 1.0),
+            ("progress", None, 0.0, None, None, 1.0, None),
+            ("task_progress", path, 0.5, 6.0, 1.0, 0.5, 6.0),
+            ("task_state", path, "running", "", ""),
+            ("run_summary", {}),
+            ("done", False),
+        ]
+        # Keep the run from touching the real history and queue state files.
+        try:
+            with mock.patch.object(backend.history_store, "add"), mock.patch.object(backend, "_save_state"):
+                backend._dispatch_events(events)
+        finally:
+            backend._timer.stop()
+
+
+if __name__ == "__main__":
+    unittest.main()
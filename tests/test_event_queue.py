@@ -0,0 +1,30 @@
+import unittest
+
+from ui.event_queue import WakeupQueue
+
+
+class WakeupQueueTest(unittest.TestCase):
+    def test_put_wakes_only_after_park(self) -> None:
+        wakeups: list[int] = []
+        events = WakeupQueue(lambda: wakeups.append(1))
+
+        events.put(("log", "INFO", "busy"))
+        self.assertEqual(wakeups, [])
+
+        events.get_nowait()
+        self.assertTrue(events.park())
+        events.put(("status", "first"))
+        events.put(("status", "second"))
+        self.assertEqual(wakeups, [1])
+        self.assertFalse(events.idle)
+
+    def test_park_refuses_when_events_are_pending(self) -> None:
+        events = WakeupQueue(lambda: None)
+        events.put(("status", "pending"))
+
+        self.assertFalse(events.park())
+        self.assertFalse(events.idle)
+
+
+if __name__ == "__main__":
+    unittest.main()
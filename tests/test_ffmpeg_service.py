@@ -1,6 +1,7 @@
 ﻿import tempfile
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
 from app.models import ConversionSettings, MediaInfo
 from services.ffmpeg_service import FfmpegService
@@ -302,6 +303,21 @@ class FfmpegServiceTest(unittest.TestCase):
         self.assertTrue(self.service.source_matches_codec_choice(MediaInfo(vcodec="h264"), "H.264 (AVC)", ".mp4"))
         self.assertFalse(self.service.source_matches_codec_choice(MediaInfo(vcodec="hevc"), "H.264 (AVC)", ".mp4"))
 
+    def test_detect_encoders_cached_reuses_result_until_binary_changes(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            binary = Path(tmp) / "ffmpeg"
+            binary.write_bytes(b"v1")
+            cache_path = Path(tmp) / "encoders.json"
+            service = FfmpegService(str(binary), None)
+            with patch.object(FfmpegService, "detect_encoders", return_value={"libx264"}) as detect:
+                self.assertEqual(service.detect_encoders_cached(cache_path), {"libx264"})
+                self.assertEqual(service.detect_encoders_cached(cache_path), {"libx264"})
+                self.assertEqual(detect.call_count, 1)
+
+                binary.write_bytes(b"v2 longer")
+                service.detect_encoders_cached(cache_path)
+                self.assertEqual(detect.call_count, 2)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,81 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from utils.files import NameAllocator, iter_media_files, media_type, safe_output_path
+
+
+class IterMediaFilesTest(unittest.TestCase):
+    def test_yields_supported_files_depth_first_in_name_order(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "b").mkdir()
+            (root / "a" / "nested").mkdir(parents=True)
+            for rel in ("z.MOV", "notes.bin", "a/clip.mp4", "a/nested/song.mp3", "b/photo.jpg"):
+                (root / rel).write_bytes(b"x")
+
+            found = [path.relative_to(root).as_posix() for path in iter_media_files(root)]
+
+        self.assertEqual(found, ["z.MOV", "a/clip.mp4", "a/nested/song.mp3", "b/photo.jpg"])
+
+    @unittest.skipUnless(hasattr(os, "symlink"), "symlinks unavailable")
+    def test_does_not_follow_symlinked_folders(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "clip.mp4").write_bytes(b"x")
+            try:
+                (root / "loop").symlink_to(root, target_is_directory=True)
+            except OSError:
+                self.skipTest("symlinks not permitted")
+
+            self.assertEqual([path.name for path in iter_media_files(root)], ["clip.mp4"])
+
+
+class MediaTypeTest(unittest.TestCase):
+    def test_classifies_by_case_insensitive_suffix(self) -> None:
+        self.assertEqual(media_type(Path("clip.MOV")), "video")
+        self.assertEqual(media_type(Path("photo.jpeg")), "image")
+        self.assertEqual(media_type(Path("song.Flac")), "audio")
+        self.assertEqual(media_type(Path("subs.srt")), "subtitle")
+        self.assertIsNone(media_type(Path("archive.bin")))
+        self.assertIsNone(media_type(Path("no_suffix")))
+
+
+class SafeOutputPathTest(unittest.TestCase):
+    def test_returns_first_free_numbered_name(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            for name in ("clip.mp4", "clip (1).mp4", "clip (3).mp4"):
+                (root / name).write_bytes(b"x")
+
+            self.assertEqual(safe_output_path(root / "clip.mp4"), root / "clip (2).mp4")
+            self.assertEqual(safe_output_path(root / "other.mp4"), root / "other.mp4")
+
+    def test_allocator_matches_safe_output_path_and_reserves(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            for name in ("clip.mp4", "clip (1).mp4"):
+                (root / name).write_bytes(b"x")
+            allocator = NameAllocator()
+
+            self.assertEqual(allocator.allocate(root / "clip.mp4", reserve=False), safe_output_path(root / "clip.mp4"))
+            self.assertEqual(allocator.allocate(root / "clip.mp4"), root / "clip (2).mp4")
+            self.assertEqual(allocator.allocate(root / "clip.mp4"), root / "clip (3).mp4")
+            self.assertEqual(allocator.allocate(root / "new.mp4"), root / "new.mp4")
+
+    def test_allocator_checks_desired_name_on_disk(self) -> None:
+        # A case-insensitive volume reports "Clip.mp4" as existing even though
+        # the listing only holds "clip.MP4"; the stat must win, as in safe_output_path.
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "clip.MP4").write_bytes(b"")
+            with mock.patch("pathlib.Path.exists", return_value=True):
+                expected = safe_output_path(root / "Clip.mp4")
+                self.assertEqual(NameAllocator().allocate(root / "Clip.mp4", reserve=False), expected)
+            self.assertEqual(expected, root / "Clip (1).mp4")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,28 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from services.folder_scanner import FolderScanner
+
+
+class FolderScannerTest(unittest.TestCase):
+    def test_scan_with_stats_classifies_before_sizing(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "clip.mp4").write_bytes(b"x" * 2048)
+            (root / "tiny.mp4").write_bytes(b"x")
+            (root / "song.mp3").write_bytes(b"x" * 2048)
+            (root / "notes.bin").write_bytes(b"x")
+            scanner = FolderScanner(type_filter="video", min_size_bytes=1024)
+
+            stats = scanner.scan_with_stats(root)
+
+        self.assertEqual([path.name for path in stats["files"]], ["clip.mp4"])
+        self.assertEqual(
+            (stats["excluded"], stats["type_filtered"], stats["size_filtered"], stats["total_scanned"]),
+            (1, 1, 1, 4),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
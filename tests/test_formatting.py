@@ -0,0 +1,47 @@
+import unittest
+
+from utils.formatting import build_atempo_chain, format_bytes, format_time, parse_ffmpeg_time, parse_float, parse_int, parse_time_to_seconds
+
+
+class FormattingTest(unittest.TestCase):
+    def test_format_time_rounds_to_whole_seconds(self) -> None:
+        self.assertEqual(format_time(None), "--:--")
+        self.assertEqual(format_time(-1), "--:--")
+        self.assertEqual(format_time(59.6), "01:00")
+        self.assertEqual(format_time(3725), "01:02:05")
+        self.assertEqual(format_time(3725.4), format_time(3725))
+
+    def test_format_bytes_units(self) -> None:
+        self.assertEqual(format_bytes(None), "--")
+        self.assertEqual(format_bytes(0), "0.0 B")
+        self.assertEqual(format_bytes(1536), "1.5 KB")
+        self.assertEqual(format_bytes(5 * 1024**3), "5.0 GB")
+        self.assertEqual(format_bytes(3 * 1024**5), "3.0 PB")
+
+    def test_parse_time_forms(self) -> None:
+        self.assertEqual(parse_time_to_seconds(" 90.5 "), 90.5)
+        self.assertEqual(parse_time_to_seconds("01:30"), 90.0)
+        self.assertEqual(parse_time_to_seconds("1:02:03.5"), 3723.5)
+        self.assertIsNone(parse_time_to_seconds("abc"))
+        self.assertEqual(parse_ffmpeg_time("00:01:23.45"), 83.45)
+        self.assertEqual(parse_ffmpeg_time("12"), 12.0)
+        self.assertIsNone(parse_ffmpeg_time("01:30"))
+        self.assertIsNone(parse_ffmpeg_time(""))
+        self.assertIsNone(parse_ffmpeg_time("1:2:3:4"))
+        self.assertIsNone(parse_ffmpeg_time("N/A"))
+
+    def test_parse_numbers_ignore_whitespace_and_reject_blank(self) -> None:
+        self.assertEqual(parse_int(" 42 "), 42)
+        self.assertEqual(parse_float("2.5\n"), 2.5)
+        self.assertIsNone(parse_int("   "))
+        self.assertIsNone(parse_int("4.2"))
+        self.assertIsNone(parse_float(""))
+
+    def test_atempo_chain_stays_within_filter_range(self) -> None:
+        self.assertEqual(build_atempo_chain(4.0), (2.0, 2.0))
+        self.assertEqual(build_atempo_chain(0.25), (0.5, 0.5))
+        self.assertEqual(build_atempo_chain(0), ())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from app.models import MediaChapter, MediaInfo
+from services.ffmpeg_service import FfmpegService
+from services.media_analysis_service import MediaAnalysisService
+from services.media_info_cache import MediaInfoCache
+
+
+class MediaInfoCacheTest(unittest.TestCase):
+    def test_round_trip_through_disk(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            media = Path(tmp) / "clip.mov"
+            media.write_bytes(b"data")
+            cache_path = Path(tmp) / "cache.json"
+            info = MediaInfo(duration=12.5, vcodec="h264", chapters=[MediaChapter(index=0, start=0.0, end=5.0, title="Intro")])
+
+            cache = MediaInfoCache(cache_path)
+            cache.put(media, info)
+            cache.save()
+
+            restored = MediaInfoCache(cache_path).get(media)
+            self.assertEqual(restored, info)
+
+    def test_modified_file_misses(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            media = Path(tmp) / "clip.mov"
+            media.write_bytes(b"data")
+            cache = MediaInfoCache(Path(tmp) / "cache.json")
+            cache.put(media, MediaInfo(duration=1.0))
+
+            media.write_bytes(b"longer data")
+            stat = media.stat()
+            os.utime(media, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            self.assertIsNone(cache.get(media))
+
+    def test_evicts_least_recently_used(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = []
+            for name in ("a.mp4", "b.mp4", "c.mp4"):
+                path = Path(tmp) / name
+                path.write_bytes(name.encode())
+                paths.append(path)
+            cache = MediaInfoCache(Path(tmp) / "cache.json", limit=2)
+            cache.put(paths[0], MediaInfo(duration=1.0))
+            cache.put(paths[1], MediaInfo(duration=2.0))
+            self.assertIsNotNone(cache.get(paths[0]))
+            cache.put(paths[2], MediaInfo(duration=3.0))
+
+            self.assertIsNotNone(cache.get(paths[0]))
+            self.assertIsNone(cache.get(paths[1]))
+            self.assertIsNotNone(cache.get(paths[2]))
+
+    def test_failed_save_is_retried(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            media = Path(tmp) / "clip.mov"
+            media.write_bytes(b"data")
+            cache_path = Path(tmp) / "cache.json"
+            cache = MediaInfoCache(cache_path)
+            cache.put(media, MediaInfo(duration=2.0))
+
+            with mock.patch("services.media_info_cache.save_json_file", side_effect=OSError("read-only")):
+                cache.save()
+            self.assertFalse(cache_path.exists())
+
+            cache.save()
+            self.assertEqual(MediaInfoCache(cache_path).get(media), MediaInfo(duration=2.0))
+
+    def test_cached_probe_never_runs_ffprobe(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            media = Path(tmp) / "clip.mov"
+            media.write_bytes(b"data")
+            cache = MediaInfoCache(Path(tmp) / "cache.json")
+            service = MediaAnalysisService(FfmpegService(None, None), info_cache=cache)
+            self.assertIsNone(service.cached_probe(media))
+
+            cache.put(media, MediaInfo(duration=4.0))
+            self.assertEqual(service.cached_probe(media), MediaInfo(duration=4.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
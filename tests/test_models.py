@@ -0,0 +1,65 @@
+import unittest
+from pathlib import Path
+
+from app.models import TaskItem
+from ui.models import LogModel, QueueModel
+
+
+class QueueModelMoveTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.model = QueueModel()
+        self.model.set_items([TaskItem(path=Path(f"/tmp/{name}.mp4"), media_type="video") for name in "abcd"])
+        self.resets: list[int] = []
+        self.model.modelReset.connect(lambda: self.resets.append(1))
+
+    def names(self) -> list[str]:
+        return [item.path.stem for item in self.model.items()]
+
+    def test_move_down_and_up_without_reset(self) -> None:
+        moves: list[tuple[int, int]] = []
+        self.model.rowsMoved.connect(lambda _parent, start, _end, _dest, row: moves.append((start, row)))
+
+        self.assertTrue(self.model.move_row(0, 2))
+        self.assertEqual(self.names(), ["b", "c", "a", "d"])
+        self.assertTrue(self.model.move_row(3, 0))
+        self.assertEqual(self.names(), ["d", "b", "c", "a"])
+        self.assertEqual(moves, [(0, 3), (3, 0)])
+        self.assertEqual(self.resets, [])
+
+    def test_out_of_range_target_is_clamped_and_noop_is_skipped(self) -> None:
+        self.assertTrue(self.model.move_row(1, 99))
+        self.assertEqual(self.names(), ["a", "c", "d", "b"])
+        self.assertFalse(self.model.move_row(3, 3))
+        self.assertFalse(self.model.move_row(-1, 0))
+
+
+class QueueModelRemoveTest(unittest.TestCase):
+    def test_contiguous_rows_are_removed_in_one_span_each(self) -> None:
+        model = QueueModel()
+        model.set_items([TaskItem(path=Path(f"/tmp/{name}.mp4"), media_type="video") for name in "abcdefg"])
+        spans: list[tuple[int, int]] = []
+        model.rowsRemoved.connect(lambda _parent, first, last: spans.append((first, last)))
+
+        self.assertEqual(model.remove_rows([1, 2, 3, 5, 99, 2]), 4)
+
+        self.assertEqual([item.path.stem for item in model.items()], ["a", "e", "g"])
+        self.assertEqual(spans, [(5, 5), (1, 3)])
+
+
+class LogModelTest(unittest.TestCase):
+    def test_extend_inserts_once_and_drops_oldest_rows(self) -> None:
+        model = LogModel(max_items=3)
+        inserts: list[tuple[int, int]] = []
+        model.rowsInserted.connect(lambda _parent, first, last: inserts.append((first, last)))
+
+        model.append("INFO", "one")
+        model.extend([("INFO", "two"), ("WARN", "three"), ("ERROR", "four")])
+
+        self.assertEqual(inserts, [(0, 0), (1, 3)])
+        self.assertEqual(model.rowCount(), 3)
+        self.assertTrue(model.line_at(0).endswith("INFO: two"))
+        self.assertTrue(model.line_at(2).endswith("ERROR: four"))
+
+
+if __name__ == "__main__":
+    unittest.main()
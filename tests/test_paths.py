@@ -0,0 +1,60 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from app import paths
+
+
+class FindFfprobeTest(unittest.TestCase):
+    def setUp(self) -> None:
+        paths._FFPROBE_CACHE.clear()
+        self.addCleanup(paths._FFPROBE_CACHE.clear)
+        env = mock.patch.dict(os.environ, {"MEDIA_CONVERTER_FFPROBE": ""})
+        env.start()
+        self.addCleanup(env.stop)
+
+    def test_reuses_lookup_for_unchanged_ffmpeg(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            exe = "ffprobe.exe" if os.name == "nt" else "ffprobe"
+            ffmpeg = Path(tmp) / "ffmpeg"
+            ffmpeg.write_text("ffmpeg", encoding="utf-8")
+            (Path(tmp) / exe).write_text("ffprobe", encoding="utf-8")
+
+            first = paths.find_ffprobe(str(ffmpeg))
+            with mock.patch.object(paths, "_resolve_ffprobe", wraps=paths._resolve_ffprobe) as resolve:
+                second = paths.find_ffprobe(str(ffmpeg))
+
+            self.assertEqual(first, str((Path(tmp) / exe).resolve()))
+            self.assertEqual(second, first)
+            resolve.assert_not_called()
+
+    def test_miss_walks_search_roots_once_and_is_not_cached(self) -> None:
+        with mock.patch.object(paths, "_find_binary", return_value=None) as find_binary:
+            self.assertIsNone(paths.find_ffprobe(None))
+            self.assertEqual(find_binary.call_count, 1)
+            self.assertIsNone(paths.find_ffprobe(None))
+            self.assertEqual(find_binary.call_count, 2)
+        self.assertEqual(paths._FFPROBE_CACHE, {})
+
+    def test_removed_ffprobe_drops_only_its_entry(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            exe = "ffprobe.exe" if os.name == "nt" else "ffprobe"
+            ffmpeg = Path(tmp) / "ffmpeg"
+            ffmpeg.write_text("ffmpeg", encoding="utf-8")
+            probe = Path(tmp) / exe
+            probe.write_text("ffprobe", encoding="utf-8")
+            self.assertIsNotNone(paths.find_ffprobe(str(ffmpeg)))
+            other_key = ("other-ffmpeg", 1, "")
+            paths._FFPROBE_CACHE[other_key] = str(ffmpeg)
+
+            probe.unlink()
+            with mock.patch.object(paths, "_find_binary", return_value=None):
+                self.assertIsNone(paths.find_ffprobe(str(ffmpeg)))
+
+            self.assertEqual(paths._FFPROBE_CACHE, {other_key: str(ffmpeg)})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,8 @@
-﻿import unittest
+﻿import tempfile
+import unittest
+from pathlib import Path
 
-from app.presets import DEFAULT_PRESETS
+from app.presets import DEFAULT_PRESETS, load_presets, save_presets
 
 
 class PresetsTest(unittest.TestCase):
@@ -15,6 +17,38 @@ class PresetsTest(unittest.TestCase):
         }
         self.assertTrue(expected.issubset(DEFAULT_PRESETS.keys()))
 
+    def test_unchanged_save_skips_write_and_load_sees_external_edit(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "presets.json"
+            presets = load_presets(path)
+            presets["Custom"] = {"crf": 20}
+            save_presets(path, presets)
+            first_mtime = path.stat().st_mtime_ns
+
+            save_presets(path, dict(presets))
+            self.assertEqual(path.stat().st_mtime_ns, first_mtime)
+            self.assertEqual(load_presets(path)["Custom"], {"crf": 20})
+
+            path.write_text('{"Custom": {"crf": 30, "preset": "slow"}}', encoding="utf-8")
+            self.assertEqual(load_presets(path)["Custom"], {"crf": 30, "preset": "slow"})
+
+    def test_loaded_presets_do_not_share_dicts_with_cache(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "presets.json"
+            presets = load_presets(path)
+            presets["Custom"] = {"crf": 20}
+            save_presets(path, presets)
+
+            presets["Custom"]["crf"] = 99
+            loaded = load_presets(path)
+            self.assertEqual(loaded["Custom"], {"crf": 20})
+            loaded["Custom"]["crf"] = 42
+            self.assertEqual(load_presets(path)["Custom"], {"crf": 20})
+
+            name = next(iter(DEFAULT_PRESETS))
+            loaded[name]["crf"] = -1
+            self.assertNotEqual(DEFAULT_PRESETS[name].get("crf"), -1)
+
 
 if __name__ == "__main__":
     unittest.main()
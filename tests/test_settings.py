@@ -124,6 +124,17 @@ class SettingsTest(unittest.TestCase):
         self.assertEqual(settings.cloud_rclone_path, "C:/Tools/rclone.exe")
         self.assertEqual(settings.cloud_remote_path, "dropbox:converted")
 
+    def test_malformed_option_values_fall_back_to_defaults(self) -> None:
+        defaults = ConversionSettings()
+        settings = settings_map_to_model(
+            {"rotate": ["90"], "wm_pos": {"x": 1}, "text_pos": ["top-left"]},
+            defaults=ConversionSettings(),
+        )
+
+        self.assertEqual(settings.rotate, defaults.rotate)
+        self.assertEqual(settings.watermark_pos, defaults.watermark_pos)
+        self.assertEqual(settings.text_pos, defaults.text_pos)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,56 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+from utils.state import load_json_file, save_json_file, write_text_atomic
+
+
+class StateFileTest(unittest.TestCase):
+    def test_round_trip_writes_utf8_without_leftovers(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "nested" / "state.json"
+            save_json_file(path, {"name": "Тема", "values": [1, 2]})
+
+            self.assertEqual(load_json_file(path), {"name": "Тема", "values": [1, 2]})
+            self.assertEqual([item.name for item in path.parent.iterdir()], ["state.json"])
+
+    def test_missing_or_corrupt_file_loads_as_none(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "state.json"
+            self.assertIsNone(load_json_file(path))
+            path.write_bytes(b"{not json")
+            self.assertIsNone(load_json_file(path))
+            path.write_bytes(b"\xff\xfe\x00")
+            self.assertIsNone(load_json_file(path))
+
+    def test_failed_write_keeps_previous_file(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "state.json"
+            write_text_atomic(path, "old")
+            with mock.patch("utils.state.os.replace", side_effect=OSError("disk full")), self.assertRaises(OSError):
+                write_text_atomic(path, "new")
+
+            self.assertEqual(path.read_text(encoding="utf-8"), "old")
+            self.assertEqual([item.name for item in Path(tmp).iterdir()], ["state.json"])
+
+    def test_orjson_load_falls_back_for_non_finite_floats(self) -> None:
+        def reject_constant(token):
+            raise ValueError(f"unexpected {token}")
+
+        def strict_loads(text):
+            return json.loads(text, parse_constant=reject_constant)
+
+        fake_orjson = SimpleNamespace(loads=strict_loads)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "state.json"
+            with mock.patch("utils.state.orjson", None):
+                save_json_file(path, {"speed": float("inf"), "name": "queue"})
+            with mock.patch("utils.state.orjson", fake_orjson):
+                self.assertEqual(load_json_file(path), {"speed": float("inf"), "name": "queue"})
+
+
+if __name__ == "__main__":
+    unittest.main()
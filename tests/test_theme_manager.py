@@ -0,0 +1,44 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from services.theme_manager import ThemeManager
+
+
+class ThemeManagerTest(unittest.TestCase):
+    def test_unchanged_value_skips_save(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            manager = ThemeManager(Path(tmp) / "theme.json")
+            with mock.patch.object(manager, "_save") as save:
+                self.assertTrue(manager.set_accent_color("#7C3AED"))
+                self.assertFalse(manager.set_accent_color("#7C3AED"))
+                self.assertFalse(manager.import_theme({"accent_color": "#7C3AED"}))
+            self.assertEqual(save.call_count, 1)
+
+    def test_deferred_changes_are_written_on_flush(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "theme.json"
+            manager = ThemeManager(path, autosave=False)
+            manager.set_accent_color("#7C3AED")
+            manager.set_layout_mode("compact")
+            self.assertTrue(manager.dirty)
+            self.assertFalse(path.exists())
+
+            manager.flush()
+
+            self.assertFalse(manager.dirty)
+            self.assertEqual(ThemeManager(path).layout_mode(), "compact")
+
+    def test_os_dark_mode_probe_is_cached_until_refresh(self) -> None:
+        self.addCleanup(setattr, ThemeManager, "_os_dark_mode", None)
+        ThemeManager._os_dark_mode = None
+        with mock.patch.object(ThemeManager, "_probe_os_dark_mode", return_value=False) as probe:
+            self.assertFalse(ThemeManager.detect_os_dark_mode())
+            self.assertFalse(ThemeManager.detect_os_dark_mode())
+            ThemeManager.detect_os_dark_mode(refresh=True)
+        self.assertEqual(probe.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
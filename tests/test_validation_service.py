@@ -29,3 +29,20 @@ def test_disk_preflight_blocks_when_temporary_and_output_space_is_insufficient(t
 
     assert "disk_space" in errors
     assert not warnings
+
+
+def test_draft_validation_reuses_asset_lookups_until_full_preflight(tmp_path):
+    watermark = tmp_path / "logo.png"
+    service = ValidationService(FakeFfmpegService())
+    raw = {"wm_path": str(watermark)}
+
+    draft = service.validate(raw, tasks=[], output_dir=str(tmp_path), ffmpeg_path="", include_queue=False)
+    assert "wm_path" in draft["errors"]
+
+    watermark.write_bytes(b"png")
+    with patch("services.validation_service.os.path.exists") as exists:
+        service.validate(raw, tasks=[], output_dir=str(tmp_path), ffmpeg_path="", include_queue=False)
+    exists.assert_not_called()
+
+    preflight = service.validate(raw, tasks=[], output_dir=str(tmp_path), ffmpeg_path="", include_queue=True)
+    assert "wm_path" not in preflight["errors"]
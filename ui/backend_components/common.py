@@ -9,7 +9,10 @@ import subprocess
 import sys
 import threading
 import time
+from collections import OrderedDict, deque
+from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
 from typing import Any, Optional
 
@@ -19,9 +22,18 @@ from app.constants import (
     ANALYTICS_EMIT_INTERVAL_SEC,
     APP_TITLE,
     APP_VERSION,
+    ENCODER_FAMILIES,
     EVENT_POLL_INTERVAL_MS,
+    FILE_DIALOG_FILTERS,
+    FOLDER_SCAN_CHUNK_SIZE,
+    LOG_HISTORY_MAX_LINES,
+    MEDIA_INFO_MEMORY_LIMIT,
+    PRESET_SAVE_DELAY_MS,
+    PROBE_DEBOUNCE_MS,
     RECENT_FOLDERS_LIMIT,
     RESOURCE_SAMPLE_INTERVAL_SEC,
+    THEME_APPLY_DELAY_MS,
+    THEME_SAVE_DELAY_MS,
     WATCH_SCAN_INTERVAL_MS,
 )
 from app.localization import normalize_language, translate
@@ -35,6 +47,7 @@ from services.ffmpeg_service import FfmpegService
 from services.folder_scanner import FolderScanner
 from services.history_store import HistoryStore
 from services.license_service import LicenseInfo, LicenseService
+from services.media_analysis_service import MediaAnalysisService
 from services.media_preview_service import MediaPreviewService
 from services.notification_service import NotificationService
 from services.paid_update_service import PaidUpdateInfo, PaidUpdateService
@@ -53,7 +66,9 @@ from services.youtube_download_service import (
     YouTubeDownloadError,
     YouTubeDownloadService,
 )
+from ui.event_queue import WakeupQueue
 from ui.models import HistoryModel, LogModel, QueueModel
+from utils.files import iter_media_files
 from utils.formatting import format_bytes, format_time
 from utils.state import load_json_file, save_json_file
 
@@ -65,12 +80,22 @@ __all__ = [
     "APP_TITLE",
     "APP_VERSION",
     "DEFAULT_FOLDER_RULES",
+    "ENCODER_FAMILIES",
     "EVENT_POLL_INTERVAL_MS",
+    "FILE_DIALOG_FILTERS",
+    "FOLDER_SCAN_CHUNK_SIZE",
+    "LOG_HISTORY_MAX_LINES",
+    "MEDIA_INFO_MEMORY_LIMIT",
+    "PRESET_SAVE_DELAY_MS",
+    "PROBE_DEBOUNCE_MS",
     "RECENT_FOLDERS_LIMIT",
     "RESOURCE_SAMPLE_INTERVAL_SEC",
+    "THEME_APPLY_DELAY_MS",
+    "THEME_SAVE_DELAY_MS",
     "WATCH_SCAN_INTERVAL_MS",
     "Any",
     "BatchWorkflowService",
+    "Callable",
     "ConversionSettings",
     "Dict",
     "DownloadProgress",
@@ -84,10 +109,12 @@ __all__ = [
     "LicenseService",
     "List",
     "LogModel",
+    "MediaAnalysisService",
     "MediaInfo",
     "MediaPreviewService",
     "NotificationService",
     "Optional",
+    "OrderedDict",
     "PaidUpdateInfo",
     "PaidUpdateService",
     "Path",
@@ -105,15 +132,19 @@ __all__ = [
     "TaskStatus",
     "ThemeManager",
     "ThreadPoolExecutor",
+    "WakeupQueue",
     "WatchService",
     "YouTubeDownloadCancelled",
     "YouTubeDownloadError",
     "YouTubeDownloadService",
     "csv",
+    "deque",
     "find_ffmpeg",
     "find_ffprobe",
     "format_bytes",
     "format_time",
+    "islice",
+    "iter_media_files",
     "load_json_file",
     "merge_settings_maps",
     "normalize_language",
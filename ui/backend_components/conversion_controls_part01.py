@@ -88,16 +88,14 @@ BODY = r'''    def _build_run_tasks(
         self._session_eta_text = "--:--"
         self._session_avg_speed_text = "--"
         self._refresh_session_stats(total_eta=None)
-        self._file_progress_text = "Файл: --"
-        self.fileProgressTextChanged.emit()
-        self._total_progress_text = "Всього: --"
-        self.totalProgressTextChanged.emit()
+        self._set_progress_text("Файл: --", "Всього: --")
         self._is_running = True
         self.isRunningChanged.emit()
         self._is_paused = False
         self.isPausedChanged.emit()
         self._set_status(self._tr("backend.conversion_started"))
         self._save_state(pending_recovery=True)
+        self._timer.start()
         self.runner.start(run_tasks, base_settings, out_dir)
 
     @QtCore.Slot("QVariantMap")
@@ -69,10 +69,17 @@ BODY = r'''            self._append_log("WARN", "Немає попередніх
             answer = QtWidgets.QMessageBox.question(None, "Пресети", "Пресет уже існує. Перезаписати?")
             if answer != QtWidgets.QMessageBox.Yes:
                 return
-        self.preset_manager.save(name, dict(settings_map))
+        self.preset_manager.save(name, dict(settings_map), persist=False)
+        self._preset_save_timer.start()
         self._refresh_presets()
         self._append_log("OK", f"Пресет збережено: {name}")
 
+    def _flush_presets(self) -> None:
+        # Snapshot on the GUI thread; a single writer thread keeps writes in order.
+        if self._preset_writer is None:
+            self._preset_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="preset-writer")
+        self._preset_writer.submit(self.preset_manager.persist, self.preset_manager.snapshot())
+
     @QtCore.Slot(str)
     def deletePreset(self, name: str) -> None:
         if not name:
@@ -80,7 +87,8 @@ BODY = r'''            self._append_log("WARN", "Немає попередніх
         answer = QtWidgets.QMessageBox.question(None, "Пресети", f"Видалити пресет '{name}'?")
         if answer != QtWidgets.QMessageBox.Yes:
             return
-        if self.preset_manager.delete(name):
+        if self.preset_manager.delete(name, persist=False):
+            self._preset_save_timer.start()
             self._refresh_presets()
             self._append_log("OK", f"Пресет видалено: {name}")
 
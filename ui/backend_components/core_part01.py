@@ -50,12 +50,15 @@ BODY = r'''    logAdded = QtCore.Signal(str, str)
     notificationChannelsChanged = QtCore.Signal()
     licenseChanged = QtCore.Signal()
     paidUpdateChanged = QtCore.Signal()
+    eventQueueWoken = QtCore.Signal()
 
     def __init__(self) -> None:
         super().__init__()
-        self.event_queue: "queue.Queue[tuple]" = queue.Queue()
-        self.ffmpeg_service = FfmpegService(find_ffmpeg(), None)
-        self.ffmpeg_service.ffprobe_path = find_ffprobe(self.ffmpeg_service.ffmpeg_path)
+        self.event_queue: "queue.Queue[tuple]" = WakeupQueue(self.eventQueueWoken.emit)
+        # Binary discovery stats several install roots; it runs on a worker thread (see _discover_ffmpeg_async).
+        self.ffmpeg_service = FfmpegService(None, None)
+        self._ffmpeg_discovery_done = False
+        self._encoder_refresh_pending = False
         self._converter_service = None
         self._runner = None
         self._media_analysis = None
@@ -66,12 +69,14 @@ BODY = r'''    logAdded = QtCore.Signal(str, str)
         self.settings_manager = SettingsManager()
         self.ffmpeg_auto_installer = FfmpegAutoInstaller()
         self.preset_manager = PresetManager()
+        self._preset_writer: Optional[ThreadPoolExecutor] = None
         self.history_store = HistoryStore()
         self.watch_service = WatchService(
             on_new_files=self._on_watch_files,
             poll_interval_sec=max(WATCH_SCAN_INTERVAL_MS / 1000.0, 0.5),
         )
-        self.theme_manager = ThemeManager()
+        self.theme_manager = ThemeManager(autosave=False)
+        self._applied_theme = tuple(self.theme_manager.export_theme().items())
         self.shortcut_manager = ShortcutManager()
         self.media_preview = MediaPreviewService(
             ffmpeg_path=self.ffmpeg_service.ffmpeg_path or "",
@@ -142,10 +147,20 @@ BODY = r'''    logAdded = QtCore.Signal(str, str)
         )
         self.queue_model.set_items(restored_items)
 
-        self.media_info_cache: Dict[Path, MediaInfo] = {}
-        self._probe_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="ffprobe-prefetch")
+        # Keys are the resolved paths QueueManager stores on each TaskItem.
+        self.media_info_cache: OrderedDict[Path, MediaInfo] = OrderedDict()
+        self._probe_executor = ThreadPoolExecutor(
+            max_workers=min(8, os.cpu_count() or 2), thread_name_prefix="ffprobe-prefetch"
+        )
         self._probe_pending: set[Path] = set()
-        self._log_lines: List[str] = []
+        # [added, duplicates, unsupported] per in-flight folder scan, reported when its final chunk lands.
+        self._folder_add_totals: Dict[str, List[int]] = {}
+        # Selection probes go through one long-lived worker; the inbox only ever
+        # holds the latest request.
+        self._probe_inbox: queue.Queue[Path] = queue.Queue(maxsize=1)
+        self._probe_worker: Optional[threading.Thread] = None
+        self._log_lines: deque[str] = deque(maxlen=LOG_HISTORY_MAX_LINES)
+        self._log_batch: Optional[List[tuple[str, str]]] = None
         self._selected_index = -1
         self._selected_path = ""
         self._output_preview_text = "Preview ще не згенеровано."
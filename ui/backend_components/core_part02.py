@@ -48,11 +48,35 @@ BODY = r'''        self._youtube_history = self.settings_manager.youtube_history
         self.history_model.set_entries(self.history_store.entries)
         self._refresh_output_preview(dict(self._last_settings_map))
 
+        self._event_handlers = self._build_event_handlers()
         self._timer = QtCore.QTimer(self)
+        self._timer.setTimerType(QtCore.Qt.CoarseTimer)
         self._timer.setInterval(EVENT_POLL_INTERVAL_MS)
         self._timer.timeout.connect(self._poll_events)
+        self.eventQueueWoken.connect(self._timer.start)
         self._timer.start()
 
+        self._probe_request_timer = QtCore.QTimer(self)
+        self._probe_request_timer.setSingleShot(True)
+        self._probe_request_timer.setInterval(PROBE_DEBOUNCE_MS)
+        self._probe_request_timer.timeout.connect(self._request_selected_probe)
+
+        self._theme_apply_timer = QtCore.QTimer(self)
+        self._theme_apply_timer.setSingleShot(True)
+        self._theme_apply_timer.setInterval(THEME_APPLY_DELAY_MS)
+        self._theme_apply_timer.timeout.connect(self._flush_theme_changed)
+
+        # Theme edits and window moves arrive in bursts; write the state file once they settle.
+        self._theme_save_timer = QtCore.QTimer(self)
+        self._theme_save_timer.setSingleShot(True)
+        self._theme_save_timer.setInterval(THEME_SAVE_DELAY_MS)
+        self._theme_save_timer.timeout.connect(self.theme_manager.flush)
+
+        self._preset_save_timer = QtCore.QTimer(self)
+        self._preset_save_timer.setSingleShot(True)
+        self._preset_save_timer.setInterval(PRESET_SAVE_DELAY_MS)
+        self._preset_save_timer.timeout.connect(self._flush_presets)
+
         self._watch_timer = QtCore.QTimer(self)
         self._watch_timer.setInterval(WATCH_SCAN_INTERVAL_MS)
         self._watch_timer.timeout.connect(self._scan_watch_folder)
@@ -62,6 +86,7 @@ BODY = r'''        self._youtube_history = self.settings_manager.youtube_history
         self._scheduler_timer.timeout.connect(self._check_scheduler)
         self._scheduler_timer.start()
         QtCore.QTimer.singleShot(2000, self._maybe_check_paid_update_on_startup)
+        threading.Thread(target=self._discover_ffmpeg_async, daemon=True).start()
 
     @property
     def converter(self):
@@ -82,9 +107,9 @@ BODY = r'''        self._youtube_history = self.settings_manager.youtube_history
     @property
     def media_analysis(self):
         if self._media_analysis is None:
-            from services.media_analysis_service import MediaAnalysisService
+            from services.media_info_cache import MediaInfoCache
 
-            self._media_analysis = MediaAnalysisService(self.ffmpeg_service)
+            self._media_analysis = MediaAnalysisService(self.ffmpeg_service, info_cache=MediaInfoCache())
         return self._media_analysis
 
     @property
@@ -43,15 +43,34 @@ BODY = r'''            self.event_queue.put(("youtube_download_progress", downlo
         self.youtubeDownloadChanged.emit()
 
     def _collect_folder_async(self, folder: Path) -> None:
+        # Stream the tree so the queue fills in while large folders are still being walked;
+        # only the last chunk is ``final`` and triggers the once-per-scan refresh.
+        chunk: List[Path] = []
         try:
-            items = [path for path in folder.rglob("*") if path.is_file()]
+            for path in iter_media_files(folder):
+                chunk.append(path)
+                if len(chunk) >= FOLDER_SCAN_CHUNK_SIZE:
+                    self._post_task_items(chunk, str(folder), final=False)
+                    chunk = []
         except Exception as exc:
             self.event_queue.put(("log", "ERROR", f"Не вдалося просканувати папку {folder}: {exc}"))
-            return
-        self.event_queue.put(("add_paths", items, str(folder)))
+        self._post_task_items(chunk, str(folder))
+
+    def _post_task_items(self, paths: List[Path], folder: str, *, final: bool = True) -> None:
+        # Worker side: classify, resolve and stat here so the GUI thread only dedupes and inserts.
+        items, _, unsupported = self.queue_manager.build_items(paths, ())
+        self.queue_manager.fill_file_sizes(items)
+        self.event_queue.put(("add_items", items, unsupported, folder, final))
 
     def _add_paths(self, paths: List[Path], *, apply_watch_rules: bool = False) -> List[TaskItem]:
         added, duplicates, unsupported = self.queue_manager.build_items(paths, self.queue_model.paths_set())
+        self.queue_manager.fill_file_sizes(added)
+        rules_applied = self._insert_task_items(added, apply_watch_rules=apply_watch_rules)
+        self._finish_task_add(len(added), duplicates, unsupported, rules_applied)
+        return added
+
+    def _insert_task_items(self, added: List[TaskItem], *, apply_watch_rules: bool = False) -> int:
+        """Insert rows and start their thumbnails/probes; return how many watch rules applied."""
         rules_applied = 0
         if added and apply_watch_rules:
             rules = self.batch_workflow.parse_rules(self._watch_rules_text)
@@ -61,12 +80,16 @@ BODY = r'''            self.event_queue.put(("youtube_download_progress", downlo
         if added:
             self.queue_model.add_items(added)
             for item in added:
-                self.queue_model.set_file_size(item.path)
-                self._prefetch_probe_async(item.path, item.media_type)
                 self._ensure_thumbnail_async(item.path, item.media_type)
+            self._prefetch_probes(added)
             self._notify_queue_stats()
+        return rules_applied
+
+    def _finish_task_add(self, added: int, duplicates: int, unsupported: int, rules_applied: int = 0) -> None:
+        # Whole-queue work (preview, codec stats, state write) runs once per add, not per chunk.
+        if added:
             self._refresh_codec_distribution()
-            self._append_log("OK", self._tr("backend.added_files", count=len(added)))
+            self._append_log("OK", self._tr("backend.added_files", count=added))
             if rules_applied:
                 self._append_log("INFO", f"Watch rules applied: {rules_applied}")
             self._refresh_output_preview(dict(self._last_settings_map))
@@ -77,5 +100,4 @@ BODY = r'''            self.event_queue.put(("youtube_download_progress", downlo
             self._append_log("WARN", self._tr("backend.unsupported_skipped", count=unsupported))
         if not added and not duplicates and not unsupported:
             self._append_log("WARN", self._tr("backend.no_tasks"))
-        return added
 '''
@@ -2,6 +2,9 @@ from __future__ import annotations
 
 BODY = r'''    @QtCore.Slot()
     def refreshEncoders(self) -> None:
+        if not self._ffmpeg_discovery_done and not self.ffmpegPath:
+            self._encoder_refresh_pending = True
+            return
         candidate = self.ffmpegPath or self.ffmpeg_service.ffmpeg_path or ""
         if candidate and (
             Path(candidate).expanduser().exists()
@@ -80,10 +83,30 @@ BODY = r'''    @QtCore.Slot()
             self._send_push_notification("FFmpeg", "FFmpeg готовий до роботи.")
             self.refreshEncoders()
 
+    def _discover_ffmpeg_async(self) -> None:
+        ffmpeg_path = find_ffmpeg()
+        self.event_queue.put(("ffmpeg_discovered", ffmpeg_path, find_ffprobe(ffmpeg_path)))
+
+    def _apply_ffmpeg_discovery(self, ffmpeg_path: Optional[str], ffprobe_path: Optional[str]) -> None:
+        self._ffmpeg_discovery_done = True
+        if not self.ffmpeg_service.ffmpeg_path:
+            self.ffmpeg_service.set_paths(ffmpeg_path, ffprobe_path)
+            self.media_preview.ffmpeg_path = self.ffmpeg_service.ffmpeg_path or ""
+            self.media_preview.ffprobe_path = self.ffmpeg_service.ffprobe_path or ""
+            # A row selected before discovery finished skipped its probe; retry it now.
+            if self.ffmpeg_service.ffprobe_path and self._selected_index >= 0:
+                self._probe_request_timer.start()
+        if not self._ffmpeg_path and ffmpeg_path:
+            self._ffmpeg_path = ffmpeg_path
+            self.ffmpegPathChanged.emit()
+        if self._encoder_refresh_pending:
+            self._encoder_refresh_pending = False
+            self.refreshEncoders()
+
     def _detect_encoders_async(self, ffmpeg_path: str) -> None:
         ffprobe_path = find_ffprobe(ffmpeg_path)
         service = FfmpegService(ffmpeg_path, ffprobe_path)
-        caps = service.detect_encoders()
+        caps = service.detect_encoders_cached()
         self.event_queue.put(("encoder_detection", ffmpeg_path, ffprobe_path, caps))
 
     def _apply_encoder_detection(self, ffmpeg_path: str, ffprobe_path: Optional[str], caps: set[str]) -> None:
@@ -92,19 +115,7 @@ BODY = r'''    @QtCore.Slot()
         self.ffmpeg_service.ffmpeg_path = ffmpeg_path
         self.ffmpeg_service.ffprobe_path = ffprobe_path
         self.ffmpeg_service.encoder_caps = set(caps)
-        summary = []
-        if {"h264_nvenc", "hevc_nvenc", "av1_nvenc"} & caps:
-            summary.append("NVENC")
-        if {"h264_qsv", "hevc_qsv", "av1_qsv"} & caps:
-            summary.append("QSV")
-        if {"h264_amf", "hevc_amf", "av1_amf"} & caps:
-            summary.append("AMF")
-        if "libx265" in caps:
-            summary.append("x265")
-        if {"libsvtav1", "libaom-av1"} & caps:
-            summary.append("AV1")
-        if "libvpx-vp9" in caps:
-            summary.append("VP9")
+        summary = [label for label, encoders in ENCODER_FAMILIES if not encoders.isdisjoint(caps)]
         self._encoder_info = f"Доступні: {', '.join(summary) if summary else 'немає даних'}"
         self.encoderInfoChanged.emit()
         self._append_log("OK", f"FFmpeg: {self.ffmpeg_service.ffmpeg_path}")
@@ -78,7 +78,7 @@ BODY = r'''        if folder:
 
     @QtCore.Slot()
     def clearLog(self) -> None:
-        self._log_lines = []
+        self._log_lines.clear()
         self.log_model.clear()
 
     @QtCore.Slot(str)
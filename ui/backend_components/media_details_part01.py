@@ -1,21 +1,46 @@
 from __future__ import annotations
 
-BODY = r'''    def _probe_media_async(self, path: Path) -> None:
-        info = self.media_analysis.probe(path)
-        self.event_queue.put(("media_info", path, info))
-
-    def _prefetch_probe_async(self, path: Path, media_kind: str) -> None:
-        if media_kind not in {"video", "audio"}:
+BODY = r'''    def _request_selected_probe(self) -> None:
+        # Fired by the debounce timer, so only the row the user settled on is probed.
+        task = self.queue_model.item_at(self._selected_index)
+        if task is None or task.media_type not in {"video", "audio"}:
             return
-        if not self.ffmpeg_service.ffprobe_path or path in self.media_info_cache or path in self._probe_pending:
+        if not self.ffmpeg_service.ffprobe_path or task.path in self.media_info_cache or task.path in self._probe_pending:
             return
-        self._probe_pending.add(path)
-
-        def run_probe() -> None:
+        self.queue_model.update_task_state(task.path, TaskStatus.ANALYZING)
+        self._notify_queue_stats()
+        try:
+            superseded = self._probe_inbox.get_nowait()
+        except queue.Empty:
+            superseded = None
+        if superseded is not None:
+            self._on_media_info_event(superseded, None)
+        self._probe_pending.add(task.path)
+        self._probe_inbox.put(task.path)
+        if self._probe_worker is None:
+            self._probe_worker = threading.Thread(target=self._probe_worker_loop, name="ffprobe-select", daemon=True)
+            self._probe_worker.start()
+
+    def _probe_worker_loop(self) -> None:
+        while True:
+            path = self._probe_inbox.get()
             info = self.media_analysis.probe(path)
             self.event_queue.put(("media_info", path, info))
 
-        self._probe_executor.submit(run_probe)
+    def _prefetch_probes(self, items: List[TaskItem]) -> None:
+        if not self.ffmpeg_service.ffprobe_path:
+            return
+        # Build the shared service (and its disk cache) here, not racily in the workers.
+        media_analysis = self.media_analysis
+        for item in items:
+            path = item.path
+            if item.media_type not in {"video", "audio"} or path in self.media_info_cache or path in self._probe_pending:
+                continue
+            self._probe_pending.add(path)
+            self._probe_executor.submit(self._prefetch_probe, media_analysis, path)
+
+    def _prefetch_probe(self, media_analysis: MediaAnalysisService, path: Path) -> None:
+        self.event_queue.put(("media_info", path, media_analysis.probe(path)))
 
     def _ensure_thumbnail_async(self, path: Path, media_kind: str) -> None:
         if media_kind == "image":
@@ -70,28 +70,22 @@ BODY = r'''    @QtCore.Slot()
 
     @QtCore.Slot(str, int)
     def movePathToIndex(self, path_text: str, target_index: int) -> None:
-        items = self.queue_manager.move_path_to_index(
-            self.queue_model.items(),
-            Path(str(path_text or "").strip()).expanduser(),
-            target_index,
-        )
-        self.queue_model.set_items(items)
+        source_index = self.queue_model.index_for_path(Path(str(path_text or "").strip()).expanduser())
+        if not self.queue_model.move_row(source_index, target_index):
+            return
         self._notify_queue_stats()
         self._refresh_output_preview(dict(self._last_settings_map))
         self._save_state()
 
     @QtCore.Slot("QVariantList")
     def removeSelected(self, indices: List[int]) -> None:
-        items, removed = self.queue_manager.remove_indices(self.queue_model.items(), indices)
-        self.queue_model.set_items(items)
-        self._after_queue_removed(removed)
+        self._after_queue_removed(self.queue_model.remove_rows(indices))
 
     @QtCore.Slot("QVariantList")
     def removeSelectedPaths(self, paths: List[Any]) -> None:
         selected = self.queue_manager.paths_from_payload(paths)
-        items, removed = self.queue_manager.remove_paths(self.queue_model.items(), selected)
-        self.queue_model.set_items(items)
-        self._after_queue_removed(removed)
+        rows = self.queue_manager.selected_indices_for_paths(self.queue_model.items(), selected)
+        self._after_queue_removed(self.queue_model.remove_rows(rows))
 
     @QtCore.Slot(str)
     def removeTaskPath(self, path_text: str) -> None:
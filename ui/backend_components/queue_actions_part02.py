@@ -223,10 +223,15 @@ BODY = r'''    @QtCore.Slot()
         if info:
             self._update_info(info)
             return
+        if task.media_type in {"video", "audio"}:
+            # A disk-cache hit only costs a stat, so answer it without a worker.
+            info = self.media_analysis.cached_probe(task.path)
+            if info:
+                self._on_media_info_event(task.path, info)
+                self._ensure_thumbnail_async(task.path, task.media_type)
+                return
         if self.ffmpeg_service.ffprobe_path and task.media_type in {"video", "audio"}:
-            self.queue_model.update_task_state(task.path, TaskStatus.ANALYZING)
-            self._notify_queue_stats()
-            threading.Thread(target=self._probe_media_async, args=(task.path,), daemon=True).start()
+            self._probe_request_timer.start()
         self._ensure_thumbnail_async(task.path, task.media_type)
 
     @QtCore.Slot(str)
@@ -94,9 +94,8 @@ BODY = r'''    def _run_preflight(self, settings_map: Dict[str, Any], *, only_pa
     @QtCore.Slot(str)
     def cleanupQueue(self, mode: str) -> None:
         normalized = str(mode or "").strip().lower()
-        kept: List[TaskItem] = []
-        removed = 0
-        for item in self.queue_model.items():
+        rows: List[int] = []
+        for idx, item in enumerate(self.queue_model.items()):
             remove = False
             if normalized in {"done", "completed", "ready"}:
                 remove = item.status in {TaskStatus.SUCCESS, TaskStatus.SKIPPED}
@@ -105,13 +104,11 @@ BODY = r'''    def _run_preflight(self, settings_map: Dict[str, Any], *, only_pa
             elif normalized in {"missing", "absent"}:
                 remove = not item.path.exists()
             if remove:
-                removed += 1
-            else:
-                kept.append(item)
+                rows.append(idx)
+        removed = self.queue_model.remove_rows(rows)
         if removed <= 0:
             self._append_log("INFO", f"Cleanup queue: 0 ({normalized or 'all'})")
             return
-        self.queue_model.set_items(kept)
         if self._selected_path and self.queue_model.index_for_path(Path(self._selected_path)) < 0:
             self._selected_path = ""
             self._selected_index = -1
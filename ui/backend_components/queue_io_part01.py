@@ -46,7 +46,7 @@ BODY = r'''    @QtCore.Property(str, notify=queueStatsChanged)
         except Exception as exc:
             self.event_queue.put(("log", "ERROR", f"Не вдалося просканувати папку {folder}: {exc}"))
             return
-        self.event_queue.put(("add_paths", files, str(folder)))
+        self._post_task_items(files, str(folder))
         if excluded or type_filtered:
             self.event_queue.put(("log", "INFO", f"Скановано: {stats['total_scanned']} файлів, виключено: {excluded}, по типу: {type_filtered}"))
 
@@ -63,14 +63,23 @@ BODY = r'''            self._save_state()
 
     def _append_log(self, level: str, msg: str) -> None:
         self._log_lines.append(f"{level}: {msg}")
-        self.log_model.append(level, msg)
+        if self._log_batch is not None:
+            self._log_batch.append((level, msg))
+        else:
+            self.log_model.append(level, msg)
         self.logAdded.emit(level, msg)
         if str(level).upper() == "ERROR":
             self._last_error_title = "Помилка виконання"
             self._last_error_details = str(msg or "").strip() or "Перевір повний FFmpeg лог."
-            self._last_error_log = "\n".join(self._log_lines[-120:])
+            self._last_error_log = "\n".join(self._recent_log_lines(120))
             self.errorStateChanged.emit()
 
+    def _recent_log_lines(self, count: int) -> List[str]:
+        # Walk back from the newest line instead of copying the whole history.
+        lines = list(islice(reversed(self._log_lines), count))
+        lines.reverse()
+        return lines
+
     def _set_status(self, text: str) -> None:
         if self._status_text == text:
             return
@@ -85,10 +94,23 @@ BODY = r'''            self._save_state()
             self._total_progress = total_pct
             self.totalProgressChanged.emit()
 
+    def _set_progress_text(self, file_text: str, total_text: str) -> None:
+        if self._file_progress_text != file_text:
+            self._file_progress_text = file_text
+            self.fileProgressTextChanged.emit()
+        if self._total_progress_text != total_text:
+            self._total_progress_text = total_text
+            self.totalProgressTextChanged.emit()
+
     def _refresh_presets(self) -> None:
-        self.presets_model.setStringList(self.preset_manager.names())
+        # setStringList() resets the model, which also drops the QML combo's selection.
+        names = self.preset_manager.names()
+        if self.presets_model.stringList() != names:
+            self.presets_model.setStringList(names)
 
     def _refresh_recent_folders(self) -> None:
+        if self.recent_folders_model.stringList() == self._recent_folders:
+            return
         self.recent_folders_model.setStringList(self._recent_folders)
         self.recentFoldersChanged.emit()
 
@@ -8,8 +8,8 @@ BODY = r'''    # --- Theme properties ---
 
     @accentColor.setter
     def accentColor(self, value: str) -> None:
-        self.theme_manager.set_accent_color(value)
-        self.themeChanged.emit()
+        if self.theme_manager.set_accent_color(value):
+            self._on_theme_edited()
 
     @QtCore.Property(str, notify=themeChanged)
     def themeMode(self) -> str:
@@ -17,8 +17,8 @@ BODY = r'''    # --- Theme properties ---
 
     @themeMode.setter
     def themeMode(self, value: str) -> None:
-        self.theme_manager.set_theme_mode(value)
-        self.themeChanged.emit()
+        if self.theme_manager.set_theme_mode(value):
+            self._on_theme_edited()
 
     @QtCore.Property(str, notify=themeChanged)
     def effectiveThemeMode(self) -> str:
@@ -35,8 +35,8 @@ BODY = r'''    # --- Theme properties ---
 
     @layoutMode.setter
     def layoutMode(self, value: str) -> None:
-        self.theme_manager.set_layout_mode(value)
-        self.themeChanged.emit()
+        if self.theme_manager.set_layout_mode(value):
+            self._on_theme_edited()
 
     @QtCore.Property(float, notify=themeChanged)
     def fontScale(self) -> float:
@@ -44,8 +44,8 @@ BODY = r'''    # --- Theme properties ---
 
     @fontScale.setter
     def fontScale(self, value: float) -> None:
-        self.theme_manager.set_font_scale(value)
-        self.themeChanged.emit()
+        if self.theme_manager.set_font_scale(value):
+            self._on_theme_edited()
 
     @QtCore.Property(bool, notify=themeChanged)
     def beginnerMode(self) -> bool:
@@ -53,8 +53,8 @@ BODY = r'''    # --- Theme properties ---
 
     @beginnerMode.setter
     def beginnerMode(self, value: bool) -> None:
-        self.theme_manager.set_beginner_mode(value)
-        self.themeChanged.emit()
+        if self.theme_manager.set_beginner_mode(value):
+            self._on_theme_edited()
 
     @QtCore.Property("QVariantList", notify=themeChanged)
     def accentPresets(self) -> List[Dict[str, str]]:
@@ -66,23 +66,34 @@ BODY = r'''    # --- Theme properties ---
 
     @QtCore.Slot(result=bool)
     def detectOsDarkMode(self) -> bool:
-        return ThemeManager.detect_os_dark_mode()
+        return ThemeManager.detect_os_dark_mode(refresh=True)
 
     @QtCore.Slot()
     def autoDetectTheme(self) -> None:
-        is_dark = ThemeManager.detect_os_dark_mode()
+        is_dark = ThemeManager.detect_os_dark_mode(refresh=True)
         self.themeMode = "dark" if is_dark else "light"
 
     @QtCore.Slot("QVariantMap")
     def importTheme(self, data: Dict[str, Any]) -> None:
-        self.theme_manager.import_theme(dict(data or {}))
-        self.themeChanged.emit()
+        if self.theme_manager.import_theme(dict(data or {})):
+            self._on_theme_edited()
         self._append_log("OK", "Тему імпортовано.")
 
     @QtCore.Slot(result="QVariantMap")
     def exportTheme(self) -> Dict[str, Any]:
         return self.theme_manager.export_theme()
 
+    def _on_theme_edited(self) -> None:
+        self._theme_apply_timer.start()
+        self._theme_save_timer.start()
+
+    def _flush_theme_changed(self) -> None:
+        # A burst of edits that ends where it started re-themes nothing.
+        applied = tuple(self.theme_manager.export_theme().items())
+        if applied != self._applied_theme:
+            self._applied_theme = applied
+            self.themeChanged.emit()
+
     @QtCore.Property(bool, notify=errorStateChanged)
     def hasLastError(self) -> bool:
         return bool(self._last_error_details)
@@ -104,13 +115,14 @@ BODY = r'''    # --- Theme properties ---
 
     @QtCore.Slot()
     def copyLastErrorLog(self) -> None:
-        text = self._last_error_log or self._last_error_details or "\n".join(self._log_lines[-80:])
+        text = self._last_error_log or self._last_error_details or "\n".join(self._recent_log_lines(80))
         if text:
             QtWidgets.QApplication.clipboard().setText(text)
 
     @QtCore.Slot(int, int, int, int)
     def saveWindowState(self, x: int, y: int, width: int, height: int) -> None:
-        self.theme_manager.set_window_state(x, y, width, height)
+        if self.theme_manager.set_window_state(x, y, width, height):
+            self._theme_save_timer.start()
 
     @QtCore.Slot(result="QVariantMap")
     def loadWindowState(self) -> Dict[str, int]:
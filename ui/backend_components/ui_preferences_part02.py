@@ -50,7 +50,7 @@ BODY = r'''        return self.shortcut_manager.all_shortcuts()
             if needle in detail.lower() or needle in str(entry.get("operation", "")).lower():
                 add("Історія", str(entry.get("operation", "Run")), detail, 1)
 
-        for line in self._log_lines[-120:]:
+        for line in self._recent_log_lines(120):
             if needle in line.lower():
                 add("Лог", line[:80], "Відкрити чергу і лог", 0)
 
@@ -42,6 +42,19 @@ BODY = r'''    def setupSystemTray(self) -> None:
     def _on_tray_quit(self) -> None:
         QtWidgets.QApplication.quit()
 
+    @QtCore.Slot()
+    def shutdown(self) -> None:
+        """Flush on-disk caches; connected to ``QCoreApplication.aboutToQuit``."""
+        if self._media_analysis is not None:
+            self._media_analysis.save_cache()
+        self._theme_save_timer.stop()
+        self.theme_manager.flush()
+        if self._preset_save_timer.isActive():
+            self._preset_save_timer.stop()
+            self._flush_presets()
+        if self._preset_writer is not None:
+            self._preset_writer.shutdown(wait=True)
+
     def _send_push_notification(self, title: str, message: str, level: str = "info") -> None:
         if not self._push_notifications_enabled:
             return
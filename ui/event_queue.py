@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import queue
+from collections.abc import Callable
+from typing import Any
+
+
+class WakeupQueue(queue.Queue):
+    """Backend event queue that can wake a parked GUI poll timer.
+
+    The GUI thread sets ``idle`` before it stops polling; the first ``put`` after
+    that clears the flag and calls ``wakeup`` (normally a Qt signal emit, which is
+    safe to call from worker threads).
+    """
+
+    def __init__(self, wakeup: Callable[[], Any]) -> None:
+        super().__init__()
+        self._wakeup = wakeup
+        self.idle = False
+
+    def put(self, item: Any, block: bool = True, timeout: float | None = None) -> None:
+        super().put(item, block, timeout)
+        if self.idle:
+            self.idle = False
+            self._wakeup()
+
+    def park(self) -> bool:
+        """Mark the consumer idle; return False if events arrived meanwhile."""
+        self.idle = True
+        if self.empty():
+            return True
+        self.idle = False
+        return False
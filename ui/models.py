@@ -1,10 +1,12 @@
 ﻿import re
 import time
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 
 from PySide6 import QtCore
 
+from app.constants import LOG_VIEW_MAX_LINES
 from app.models import MediaInfo, TaskItem, TaskStatus
 from utils.formatting import format_bytes, format_time
 
@@ -169,12 +171,41 @@ class QueueModel(QtCore.QAbstractListModel):
         self._items = list(items)
         self.endResetModel()
 
-    def update_item(self, index: int, item: TaskItem) -> None:
+    def remove_rows(self, rows: Iterable[int]) -> int:
+        """Remove the given rows, one beginRemoveRows span per contiguous run."""
+        selected = sorted({row for row in rows if 0 <= row < len(self._items)}, reverse=True)
+        index = 0
+        while index < len(selected):
+            last = first = selected[index]
+            index += 1
+            while index < len(selected) and selected[index] == first - 1:
+                first = selected[index]
+                index += 1
+            self.beginRemoveRows(QtCore.QModelIndex(), first, last)
+            del self._items[first : last + 1]
+            self.endRemoveRows()
+        return len(selected)
+
+    def move_row(self, source: int, target: int) -> bool:
+        count = len(self._items)
+        if source < 0 or source >= count:
+            return False
+        target = max(0, min(target, count - 1))
+        if target == source:
+            return False
+        destination = target + 1 if target > source else target
+        if not self.beginMoveRows(QtCore.QModelIndex(), source, source, QtCore.QModelIndex(), destination):
+            return False
+        self._items.insert(target, self._items.pop(source))
+        self.endMoveRows()
+        return True
+
+    def update_item(self, index: int, item: TaskItem, roles: list[int] | None = None) -> None:
         if index < 0 or index >= len(self._items):
             return
         self._items[index] = item
         model_index = self.index(index, 0)
-        self.dataChanged.emit(model_index, model_index, list(self.roleNames().keys()))
+        self.dataChanged.emit(model_index, model_index, roles if roles is not None else list(self.roleNames().keys()))
 
     def update_task_state(self, task_path: Path, status: str, message: str = "", output_path: str = "") -> None:
         for idx, item in enumerate(self._items):
@@ -215,7 +246,8 @@ class QueueModel(QtCore.QAbstractListModel):
             item.progress = bounded
             item.eta_text = eta_text
             item.speed_text = speed_text
-            self.update_item(idx, item)
+            # Progress ticks only touch these roles; leave thumbnails and labels alone.
+            self.update_item(idx, item, [self.ProgressRole, self.EtaRole, self.SpeedRole])
             return
 
     def set_preview_output(self, task_path: Path, preview_output: str) -> None:
@@ -310,20 +342,6 @@ class QueueModel(QtCore.QAbstractListModel):
             self.update_item(idx, item)
             return
 
-    def set_file_size(self, task_path: Path) -> None:
-        for idx, item in enumerate(self._items):
-            if item.path != task_path:
-                continue
-            try:
-                size_text = format_bytes(item.path.stat().st_size)
-            except Exception:
-                size_text = "—"
-            if item.size_text == size_text:
-                return
-            item.size_text = size_text
-            self.update_item(idx, item)
-            return
-
     def set_thumbnail(self, task_path: Path, thumbnail_path: str) -> None:
         for idx, item in enumerate(self._items):
             if item.path != task_path:
@@ -356,9 +374,10 @@ class LogModel(QtCore.QAbstractListModel):
     MessageRole = QtCore.Qt.UserRole + 3
     LineRole = QtCore.Qt.UserRole + 4
 
-    def __init__(self, parent: QtCore.QObject | None = None) -> None:
+    def __init__(self, parent: QtCore.QObject | None = None, max_items: int = LOG_VIEW_MAX_LINES) -> None:
         super().__init__(parent)
         self._items: list[dict[str, str]] = []
+        self._max_items = max(1, int(max_items))
 
     def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
         if parent.isValid():
@@ -390,12 +409,26 @@ class LogModel(QtCore.QAbstractListModel):
         }
 
     def append(self, level: str, message: str) -> None:
+        self.extend([(level, message)])
+
+    def extend(self, entries: list[tuple[str, str]]) -> None:
+        """Append a batch of (level, message) rows, dropping the oldest past ``max_items``."""
+        entries = entries[-self._max_items :]
+        if not entries:
+            return
         time_text = time.strftime("%H:%M:%S")
-        line = f"[{time_text}] {level}: {message}"
         row = len(self._items)
-        self.beginInsertRows(QtCore.QModelIndex(), row, row)
-        self._items.append({"time": time_text, "level": level, "message": message, "line": line})
+        self.beginInsertRows(QtCore.QModelIndex(), row, row + len(entries) - 1)
+        self._items.extend(
+            {"time": time_text, "level": level, "message": message, "line": f"[{time_text}] {level}: {message}"}
+            for level, message in entries
+        )
         self.endInsertRows()
+        overflow = len(self._items) - self._max_items
+        if overflow > 0:
+            self.beginRemoveRows(QtCore.QModelIndex(), 0, overflow - 1)
+            del self._items[:overflow]
+            self.endRemoveRows()
 
     def clear(self) -> None:
         self.beginResetModel()
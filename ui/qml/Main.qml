@@ -122,6 +122,8 @@ ApplicationWindow {
     }
 
     function scheduleSettingsSync() {
+        if (settingsPanel && settingsPanel.applyingPreset)
+            return
         settingsSyncTimer.restart()
     }
 
@@ -683,17 +685,18 @@ ApplicationWindow {
                 currentIndex: root.activeSection
 
                 AppScreens.QueueScreen { appRoot: root }
-                AnalyticsScreen {}
-                PresetsScreen {}
-                FfmpegScreen {}
-                YoutubeScreen {}
+                LazyScreen { sourceComponent: Component { AnalyticsScreen {} } }
+                LazyScreen { sourceComponent: Component { PresetsScreen {} } }
+                LazyScreen { sourceComponent: Component { FfmpegScreen {} } }
+                LazyScreen { sourceComponent: Component { YoutubeScreen {} } }
                 ScrollView {
                     id: settingsScroll
                     clip: true
                     ScrollBar.horizontal.policy: ScrollBar.AlwaysOff
 
                     ColumnLayout {
-                        width: settingsScroll.availableWidth
+                        // Hidden pages keep their last width so window resizes don't relayout them off-screen.
+                        width: settingsScroll.visible ? settingsScroll.availableWidth : width
                         anchors.margins: Theme.space4
                         spacing: Theme.space3
 
@@ -986,6 +989,12 @@ ApplicationWindow {
         }
     }
 
+    // Secondary screens are built on first visit and kept alive afterwards.
+    component LazyScreen: Loader {
+        active: false
+        onVisibleChanged: if (visible) active = true
+    }
+
     component AnalyticsScreen: Item {
         AnalyticsPanel {
             anchors.fill: parent
@@ -1002,7 +1011,7 @@ ApplicationWindow {
         clip: true
 
         ColumnLayout {
-            width: presetsScreen.availableWidth
+            width: presetsScreen.visible ? presetsScreen.availableWidth : width
             spacing: 12
             anchors.margins: 12
 
@@ -1050,7 +1059,7 @@ ApplicationWindow {
         clip: true
 
         ColumnLayout {
-            width: ffmpegScreen.availableWidth
+            width: ffmpegScreen.visible ? ffmpegScreen.availableWidth : width
             spacing: 12
             anchors.margins: 12
 
@@ -1089,7 +1098,7 @@ ApplicationWindow {
         clip: true
 
         ColumnLayout {
-            width: youtubeScreen.availableWidth
+            width: youtubeScreen.visible ? youtubeScreen.availableWidth : width
             spacing: 12
             anchors.margins: 12
 
@@ -1643,126 +1652,183 @@ ApplicationWindow {
         id: settingsRoot
         spacing: 12
 
+        // One row per settings key: how to read it for collectSettings() and how a
+        // preset value is written back. Rows without a fallback leave the control
+        // untouched when the preset has no (truthy, for text/combos) value.
+        readonly property var fieldSchema: [
+            { key: "operation", item: operationCombo, kind: "combo" },
+            { key: "out_video_fmt", item: outVideoFmt, kind: "combo" },
+            { key: "out_image_fmt", item: outImageFmt, kind: "combo" },
+            { key: "out_audio_fmt", item: outAudioFmt, kind: "combo" },
+            { key: "out_subtitle_fmt", item: outSubtitleFmt, kind: "combo" },
+            { key: "out_text_fmt", item: outTextFmt, kind: "combo" },
+            { key: "audio_bitrate", item: audioBitrateField, kind: "text" },
+            { key: "audio_codec", item: audioCodecCombo, kind: "combo" },
+            { key: "audio_track_index", item: audioTrackSpin, kind: "spin", offset: 1 },
+            { key: "crf", item: crfSpin, kind: "spin" },
+            { key: "preset", item: presetCombo, kind: "combo" },
+            { key: "performance_profile", item: performanceProfileCombo, kind: "combo" },
+            { key: "target_size_mb", item: targetSizeField, kind: "text", fallback: "" },
+            { key: "cpu_load_limit", item: cpuLimitSpin, kind: "spin" },
+            { key: "gpu_load_limit", item: gpuLimitSpin, kind: "spin" },
+            { key: "disk_safety_margin_mb", item: diskSafetyMarginSpin, kind: "spin" },
+            { key: "smart_convert_enabled", item: smartConvertCheck, kind: "check", fallback: false },
+            { key: "smart_content_type", item: smartContentTypeCombo, kind: "combo", fallback: "auto" },
+            { key: "smart_quality_target", item: smartQualityTargetCombo, kind: "combo", fallback: "balanced" },
+            { key: "smart_reencode_detection", item: smartReencodeCheck, kind: "check", fallback: true },
+            { key: "smart_two_pass", item: smartTwoPassCheck, kind: "check", fallback: false },
+            { key: "smart_integrity_check", item: smartIntegrityCheck, kind: "check", fallback: false },
+            { key: "smart_quality_metric", item: smartQualityMetricCombo, kind: "combo", fallback: "none" },
+            { key: "smart_ab_test", item: smartAbTestCheck, kind: "check", fallback: false },
+            { key: "smart_ab_crfs", item: smartAbCrfsField, kind: "text", fallback: "18,23,28" },
+            { key: "smart_ab_duration", item: smartAbDurationSpin, kind: "spin" },
+            { key: "portrait", item: portraitCombo, kind: "canonical", options: root.portraitCanonicalOptions },
+            { key: "img_quality", item: imgQualitySpin, kind: "spin" },
+            { key: "overwrite", item: overwriteCheck, kind: "check", fallback: false },
+            { key: "fast_copy", item: fastCopyCheck, kind: "check", fallback: false },
+            { key: "skip_existing", item: skipExistingCheck, kind: "check", fallback: false },
+            { key: "output_collision_policy", item: collisionPolicyCombo, kind: "combo", manualApply: true },
+            { key: "output_template", item: outputTemplateField, kind: "text", fallback: "{stem}" },
+            { key: "commercial_export", item: commercialExportCheck, kind: "check", fallback: false },
+            { key: "platform_profile", item: platformProfileField, kind: "text", fallback: "" },
+            { key: "trim_start", item: trimStartField, kind: "text", fallback: "" },
+            { key: "trim_end", item: trimEndField, kind: "text", fallback: "" },
+            { key: "merge", item: mergeCheck, kind: "check", fallback: false },
+            { key: "merge_name", item: mergeNameField, kind: "text", fallback: "merged" },
+            { key: "resize_w", item: resizeWField, kind: "text", fallback: "" },
+            { key: "resize_h", item: resizeHField, kind: "text", fallback: "" },
+            { key: "crop_w", item: cropWField, kind: "text", fallback: "" },
+            { key: "crop_h", item: cropHField, kind: "text", fallback: "" },
+            { key: "crop_x", item: cropXField, kind: "text", fallback: "" },
+            { key: "crop_y", item: cropYField, kind: "text", fallback: "" },
+            { key: "rotate", item: rotateCombo, kind: "canonical", options: root.rotateCanonicalOptions },
+            { key: "speed", item: speedField, kind: "text", fallback: "" },
+            { key: "subtitle_mode", item: subtitleModeCombo, kind: "combo", fallback: "none" },
+            { key: "subtitle_path", item: subtitlePathField, kind: "text", fallback: "" },
+            { key: "subtitle_stream", item: subtitleStreamSpin, kind: "spin" },
+            { key: "subtitle_out_fmt", item: outSubtitleFmt, kind: "combo", collectOnly: true },
+            { key: "subtitle_language", item: subtitleLanguageField, kind: "text", fallback: "auto" },
+            { key: "subtitle_model", item: subtitleModelCombo, kind: "combo", fallback: "base" },
+            { key: "subtitle_engine", item: subtitleEngineCombo, kind: "combo", fallback: "auto" },
+            { key: "thumbnail_time", item: thumbnailTimeField, kind: "text", fallback: "" },
+            { key: "sheet_cols", item: sheetColsSpin, kind: "spin" },
+            { key: "sheet_rows", item: sheetRowsSpin, kind: "spin" },
+            { key: "sheet_width", item: sheetWidthSpin, kind: "spin" },
+            { key: "sheet_interval", item: sheetIntervalSpin, kind: "spin" },
+            { key: "wm_path", item: wmPathField, kind: "text", fallback: "" },
+            { key: "wm_pos", item: wmPosCombo, kind: "canonical", options: root.positionCanonicalOptions },
+            { key: "wm_opacity", item: wmOpacitySpin, kind: "spin" },
+            { key: "wm_scale", item: wmScaleSpin, kind: "spin" },
+            { key: "text_wm", item: textWatermarkField, kind: "text", fallback: "" },
+            { key: "text_pos", item: textPosCombo, kind: "canonical", options: root.positionCanonicalOptions },
+            { key: "text_size", item: textSizeSpin, kind: "spin" },
+            { key: "text_color", item: textColorField, kind: "text", fallback: "white" },
+            { key: "text_box", item: textBoxCheck, kind: "check", fallback: false },
+            { key: "text_box_color", item: textBoxColorField, kind: "text", fallback: "black" },
+            { key: "text_box_opacity", item: textBoxOpacitySpin, kind: "spin" },
+            { key: "text_font", item: textFontField, kind: "text", fallback: "" },
+            { key: "codec", item: codecCombo, kind: "combo" },
+            { key: "hw", item: hwCombo, kind: "combo" },
+            { key: "replace_audio_path", item: replaceAudioPathField, kind: "text", fallback: "" },
+            { key: "normalize_audio", item: normalizeAudioCombo, kind: "combo", fallback: "none" },
+            { key: "audio_peak_limit_db", item: peakLimitField, kind: "text", fallback: "" },
+            { key: "trim_silence", item: trimSilenceCheck, kind: "check", fallback: false },
+            { key: "silence_threshold_db", item: silenceThresholdSpin, kind: "spin", fallback: -50 },
+            { key: "silence_duration", item: silenceDurationField, kind: "text", fallback: "0.3" },
+            { key: "split_chapters", item: splitChaptersCheck, kind: "check", fallback: false },
+            { key: "cover_art_path", item: coverArtField, kind: "text", fallback: "" },
+            { key: "before_hook", item: beforeHookField, kind: "text", fallback: "" },
+            { key: "after_hook", item: afterHookField, kind: "text", fallback: "" },
+            { key: "strip_metadata", item: stripMetadataCheck, kind: "check", fallback: false },
+            { key: "copy_metadata", item: copyMetadataCheck, kind: "check", fallback: false },
+            { key: "meta_title", item: metaTitleField, kind: "text", fallback: "" },
+            { key: "meta_comment", item: metaCommentField, kind: "text", fallback: "" },
+            { key: "meta_author", item: metaAuthorField, kind: "text", fallback: "" },
+            { key: "meta_copyright", item: metaCopyrightField, kind: "text", fallback: "" },
+            { key: "meta_album", item: metaAlbumField, kind: "text", fallback: "" },
+            { key: "meta_genre", item: metaGenreField, kind: "text", fallback: "" },
+            { key: "meta_year", item: metaYearField, kind: "text", fallback: "" },
+            { key: "meta_track", item: metaTrackField, kind: "text", fallback: "" },
+            { key: "device_profile", item: deviceProfileCombo, kind: "combo" },
+            { key: "privacy_blur_regions", item: privacyBlurRegionsField, kind: "text", fallback: "" },
+            { key: "ai_blur_enabled", item: aiBlurCheck, kind: "check", fallback: false },
+            { key: "sanitize_metadata", item: stripMetadataCheck, kind: "check", collectOnly: true },
+            { key: "checksum_algorithm", item: checksumCombo, kind: "combo", manualApply: true },
+            { key: "secure_delete_original", item: secureDeleteCheck, kind: "check", fallback: false },
+            { key: "subtitle_sync_ms", item: subtitleSyncField, kind: "text", fallback: "" },
+            { key: "subtitle_style_enabled", item: subtitleStyleCheck, kind: "check", fallback: false },
+            { key: "subtitle_font_name", item: subtitleFontNameField, kind: "text", fallback: "" },
+            { key: "subtitle_font_size", item: subtitleFontSizeSpin, kind: "spin" },
+            { key: "subtitle_primary_color", item: subtitlePrimaryColorField, kind: "text", fallback: "white" },
+            { key: "subtitle_outline", item: subtitleOutlineSpin, kind: "spin" },
+            { key: "subtitle_shadow", item: subtitleShadowSpin, kind: "spin" },
+            { key: "subtitle_alignment", item: subtitleAlignmentSpin, kind: "spin" },
+            { key: "editor_deinterlace", item: editorDeinterlaceCheck, kind: "check", fallback: false },
+            { key: "editor_stabilize", item: editorStabilizeCheck, kind: "check", fallback: false },
+            { key: "editor_denoise", item: editorDenoiseCombo, kind: "combo", fallback: "none" },
+            { key: "editor_brightness", item: editorBrightnessField, kind: "text", fallback: "" },
+            { key: "editor_contrast", item: editorContrastField, kind: "text", fallback: "" },
+            { key: "editor_saturation", item: editorSaturationField, kind: "text", fallback: "" },
+            { key: "editor_gamma", item: editorGammaField, kind: "text", fallback: "" },
+            { key: "editor_lut_path", item: editorLutPathField, kind: "text", fallback: "" },
+            { key: "cloud_upload_enabled", item: cloudUploadCheck, kind: "check", fallback: false },
+            { key: "cloud_provider", item: cloudProviderCombo, kind: "combo", fallback: "rclone" },
+            { key: "cloud_rclone_path", item: cloudRclonePathField, kind: "text", fallback: "rclone" },
+            { key: "cloud_remote_path", item: cloudRemotePathField, kind: "text", fallback: "" }
+        ]
+        property var _collectedSettings: null
+        // Set while applyPreset writes controls, so their change handlers don't each
+        // invalidate the cache and restart the sync timer.
+        property bool applyingPreset: false
+
+        function invalidateCollectedSettings() {
+            if (!applyingPreset)
+                _collectedSettings = null
+        }
+
+        function readField(field) {
+            if (field.kind === "combo") return field.item.currentText
+            if (field.kind === "text") return field.item.text
+            if (field.kind === "check") return field.item.checked
+            if (field.kind === "spin") return field.item.value - (field.offset || 0)
+            return root.canonicalOption(field.options, field.item.currentIndex, field.item.currentText)
+        }
+
+        function applyField(field, value) {
+            var hasFallback = field.fallback !== undefined
+            if (field.kind === "check") {
+                field.item.checked = value === undefined ? field.fallback : !!value
+            } else if (field.kind === "spin") {
+                if (value !== undefined)
+                    field.item.value = Number(value) + (field.offset || 0)
+                else if (hasFallback)
+                    field.item.value = field.fallback
+            } else if (value || hasFallback) {
+                if (field.kind === "text")
+                    field.item.text = value || field.fallback
+                else if (field.kind === "combo")
+                    root.setComboText(field.item, value || field.fallback)
+                else
+                    root.setComboCanonical(field.item, value, field.options)
+            }
+        }
+
         function applyPreset(preset) {
             if (!preset)
                 return
-            if (preset.operation) root.setComboText(operationCombo, preset.operation)
-            if (preset.out_video_fmt) root.setComboText(outVideoFmt, preset.out_video_fmt)
-            if (preset.out_image_fmt) root.setComboText(outImageFmt, preset.out_image_fmt)
-            if (preset.out_audio_fmt) root.setComboText(outAudioFmt, preset.out_audio_fmt)
-            if (preset.out_subtitle_fmt) root.setComboText(outSubtitleFmt, preset.out_subtitle_fmt)
-            if (preset.out_text_fmt) root.setComboText(outTextFmt, preset.out_text_fmt)
-            if (preset.audio_bitrate) audioBitrateField.text = preset.audio_bitrate
-            if (preset.audio_codec) root.setComboText(audioCodecCombo, preset.audio_codec)
-            if (preset.audio_track_index !== undefined) audioTrackSpin.value = Number(preset.audio_track_index) + 1
-            if (preset.crf !== undefined) crfSpin.value = Number(preset.crf)
-            if (preset.preset) root.setComboText(presetCombo, preset.preset)
-            if (preset.performance_profile) root.setComboText(performanceProfileCombo, preset.performance_profile)
-            targetSizeField.text = preset.target_size_mb || ""
-            if (preset.cpu_load_limit !== undefined) cpuLimitSpin.value = Number(preset.cpu_load_limit)
-            if (preset.gpu_load_limit !== undefined) gpuLimitSpin.value = Number(preset.gpu_load_limit)
-            smartConvertCheck.checked = !!preset.smart_convert_enabled
-            root.setComboText(smartContentTypeCombo, preset.smart_content_type || "auto")
-            root.setComboText(smartQualityTargetCombo, preset.smart_quality_target || "balanced")
-            smartReencodeCheck.checked = preset.smart_reencode_detection === undefined ? true : !!preset.smart_reencode_detection
-            smartTwoPassCheck.checked = !!preset.smart_two_pass
-            smartIntegrityCheck.checked = !!preset.smart_integrity_check
-            root.setComboText(smartQualityMetricCombo, preset.smart_quality_metric || "none")
-            smartAbTestCheck.checked = !!preset.smart_ab_test
-            smartAbCrfsField.text = preset.smart_ab_crfs || "18,23,28"
-            if (preset.smart_ab_duration !== undefined) smartAbDurationSpin.value = Number(preset.smart_ab_duration)
-            if (preset.portrait) root.setComboCanonical(portraitCombo, preset.portrait, root.portraitCanonicalOptions)
-            if (preset.img_quality !== undefined) imgQualitySpin.value = Number(preset.img_quality)
-            overwriteCheck.checked = !!preset.overwrite
-            fastCopyCheck.checked = !!preset.fast_copy
-            skipExistingCheck.checked = !!preset.skip_existing
-            root.setComboText(collisionPolicyCombo, preset.output_collision_policy || (preset.overwrite ? "overwrite" : preset.skip_existing ? "stop" : "index"))
-            if (preset.disk_safety_margin_mb !== undefined) diskSafetyMarginSpin.value = Number(preset.disk_safety_margin_mb)
-            outputTemplateField.text = preset.output_template || "{stem}"
-            commercialExportCheck.checked = !!preset.commercial_export
-            platformProfileField.text = preset.platform_profile || ""
-            trimStartField.text = preset.trim_start || ""
-            trimEndField.text = preset.trim_end || ""
-            mergeCheck.checked = !!preset.merge
-            mergeNameField.text = preset.merge_name || "merged"
-            resizeWField.text = preset.resize_w || ""
-            resizeHField.text = preset.resize_h || ""
-            cropWField.text = preset.crop_w || ""
-            cropHField.text = preset.crop_h || ""
-            cropXField.text = preset.crop_x || ""
-            cropYField.text = preset.crop_y || ""
-            if (preset.rotate) root.setComboCanonical(rotateCombo, preset.rotate, root.rotateCanonicalOptions)
-            speedField.text = preset.speed || ""
-            root.setComboText(subtitleModeCombo, preset.subtitle_mode || "none")
-            subtitlePathField.text = preset.subtitle_path || ""
-            if (preset.subtitle_stream !== undefined) subtitleStreamSpin.value = Number(preset.subtitle_stream)
-            subtitleLanguageField.text = preset.subtitle_language || "auto"
-            root.setComboText(subtitleModelCombo, preset.subtitle_model || "base")
-            root.setComboText(subtitleEngineCombo, preset.subtitle_engine || "auto")
-            thumbnailTimeField.text = preset.thumbnail_time || ""
-            if (preset.sheet_cols !== undefined) sheetColsSpin.value = Number(preset.sheet_cols)
-            if (preset.sheet_rows !== undefined) sheetRowsSpin.value = Number(preset.sheet_rows)
-            if (preset.sheet_width !== undefined) sheetWidthSpin.value = Number(preset.sheet_width)
-            if (preset.sheet_interval !== undefined) sheetIntervalSpin.value = Number(preset.sheet_interval)
-            wmPathField.text = preset.wm_path || ""
-            if (preset.wm_pos) root.setComboCanonical(wmPosCombo, preset.wm_pos, root.positionCanonicalOptions)
-            if (preset.wm_opacity !== undefined) wmOpacitySpin.value = Number(preset.wm_opacity)
-            if (preset.wm_scale !== undefined) wmScaleSpin.value = Number(preset.wm_scale)
-            textWatermarkField.text = preset.text_wm || ""
-            if (preset.text_pos) root.setComboCanonical(textPosCombo, preset.text_pos, root.positionCanonicalOptions)
-            if (preset.text_size !== undefined) textSizeSpin.value = Number(preset.text_size)
-            textColorField.text = preset.text_color || "white"
-            textBoxCheck.checked = !!preset.text_box
-            textBoxColorField.text = preset.text_box_color || "black"
-            if (preset.text_box_opacity !== undefined) textBoxOpacitySpin.value = Number(preset.text_box_opacity)
-            textFontField.text = preset.text_font || ""
-            if (preset.codec) root.setComboText(codecCombo, preset.codec)
-            if (preset.hw) root.setComboText(hwCombo, preset.hw)
-            replaceAudioPathField.text = preset.replace_audio_path || ""
-            root.setComboText(normalizeAudioCombo, preset.normalize_audio || "none")
-            peakLimitField.text = preset.audio_peak_limit_db || ""
-            trimSilenceCheck.checked = !!preset.trim_silence
-            silenceThresholdSpin.value = preset.silence_threshold_db !== undefined ? Number(preset.silence_threshold_db) : -50
-            silenceDurationField.text = preset.silence_duration || "0.3"
-            splitChaptersCheck.checked = !!preset.split_chapters
-            coverArtField.text = preset.cover_art_path || ""
-            beforeHookField.text = preset.before_hook || ""
-            afterHookField.text = preset.after_hook || ""
-            stripMetadataCheck.checked = !!preset.strip_metadata
-            copyMetadataCheck.checked = !!preset.copy_metadata
-            metaTitleField.text = preset.meta_title || ""
-            metaCommentField.text = preset.meta_comment || ""
-            metaAuthorField.text = preset.meta_author || ""
-            metaCopyrightField.text = preset.meta_copyright || ""
-            metaAlbumField.text = preset.meta_album || ""
-            metaGenreField.text = preset.meta_genre || ""
-            metaYearField.text = preset.meta_year || ""
-            metaTrackField.text = preset.meta_track || ""
-            if (preset.device_profile) root.setComboText(deviceProfileCombo, preset.device_profile)
-            privacyBlurRegionsField.text = preset.privacy_blur_regions || ""
-            aiBlurCheck.checked = !!preset.ai_blur_enabled
-            checksumCombo.currentIndex = Math.max(0, checksumCombo.find(preset.checksum_algorithm || "none"))
-            secureDeleteCheck.checked = !!preset.secure_delete_original
-            subtitleSyncField.text = preset.subtitle_sync_ms || ""
-            subtitleStyleCheck.checked = !!preset.subtitle_style_enabled
-            subtitleFontNameField.text = preset.subtitle_font_name || ""
-            if (preset.subtitle_font_size !== undefined) subtitleFontSizeSpin.value = Number(preset.subtitle_font_size)
-            subtitlePrimaryColorField.text = preset.subtitle_primary_color || "white"
-            if (preset.subtitle_outline !== undefined) subtitleOutlineSpin.value = Number(preset.subtitle_outline)
-            if (preset.subtitle_shadow !== undefined) subtitleShadowSpin.value = Number(preset.subtitle_shadow)
-            if (preset.subtitle_alignment !== undefined) subtitleAlignmentSpin.value = Number(preset.subtitle_alignment)
-            editorDeinterlaceCheck.checked = !!preset.editor_deinterlace
-            editorStabilizeCheck.checked = !!preset.editor_stabilize
-            root.setComboText(editorDenoiseCombo, preset.editor_denoise || "none")
-            editorBrightnessField.text = preset.editor_brightness || ""
-            editorContrastField.text = preset.editor_contrast || ""
-            editorSaturationField.text = preset.editor_saturation || ""
-            editorGammaField.text = preset.editor_gamma || ""
-            editorLutPathField.text = preset.editor_lut_path || ""
-            cloudUploadCheck.checked = !!preset.cloud_upload_enabled
-            root.setComboText(cloudProviderCombo, preset.cloud_provider || "rclone")
-            cloudRclonePathField.text = preset.cloud_rclone_path || "rclone"
-            cloudRemotePathField.text = preset.cloud_remote_path || ""
+            applyingPreset = true
+            try {
+                for (var i = 0; i < fieldSchema.length; ++i) {
+                    var field = fieldSchema[i]
+                    if (!field.collectOnly && !field.manualApply)
+                        applyField(field, preset[field.key])
+                }
+                root.setComboText(collisionPolicyCombo, preset.output_collision_policy || (preset.overwrite ? "overwrite" : preset.skip_existing ? "stop" : "index"))
+                checksumCombo.currentIndex = Math.max(0, checksumCombo.find(preset.checksum_algorithm || "none"))
+            } finally {
+                applyingPreset = false
+            }
+            invalidateCollectedSettings()
             root.scheduleSettingsSync()
         }
 
@@ -1783,127 +1849,21 @@ ApplicationWindow {
         }
 
         function collectSettings() {
-            return {
-                operation: operationCombo.currentText,
-                out_video_fmt: outVideoFmt.currentText,
-                out_image_fmt: outImageFmt.currentText,
-                out_audio_fmt: outAudioFmt.currentText,
-                out_subtitle_fmt: outSubtitleFmt.currentText,
-                out_text_fmt: outTextFmt.currentText,
-                audio_bitrate: audioBitrateField.text,
-                audio_codec: audioCodecCombo.currentText,
-                audio_track_index: audioTrackSpin.value - 1,
-                crf: crfSpin.value,
-                preset: presetCombo.currentText,
-                performance_profile: performanceProfileCombo.currentText,
-                target_size_mb: targetSizeField.text,
-                cpu_load_limit: cpuLimitSpin.value,
-                gpu_load_limit: gpuLimitSpin.value,
-                disk_safety_margin_mb: diskSafetyMarginSpin.value,
-                smart_convert_enabled: smartConvertCheck.checked,
-                smart_content_type: smartContentTypeCombo.currentText,
-                smart_quality_target: smartQualityTargetCombo.currentText,
-                smart_reencode_detection: smartReencodeCheck.checked,
-                smart_two_pass: smartTwoPassCheck.checked,
-                smart_integrity_check: smartIntegrityCheck.checked,
-                smart_quality_metric: smartQualityMetricCombo.currentText,
-                smart_ab_test: smartAbTestCheck.checked,
-                smart_ab_crfs: smartAbCrfsField.text,
-                smart_ab_duration: smartAbDurationSpin.value,
-                portrait: root.canonicalOption(root.portraitCanonicalOptions, portraitCombo.currentIndex, portraitCombo.currentText),
-                img_quality: imgQualitySpin.value,
-                overwrite: overwriteCheck.checked,
-                fast_copy: fastCopyCheck.checked,
-                skip_existing: skipExistingCheck.checked,
-                output_collision_policy: collisionPolicyCombo.currentText,
-                output_template: outputTemplateField.text,
-                commercial_export: commercialExportCheck.checked,
-                platform_profile: platformProfileField.text,
-                trim_start: trimStartField.text,
-                trim_end: trimEndField.text,
-                merge: mergeCheck.checked,
-                merge_name: mergeNameField.text,
-                resize_w: resizeWField.text,
-                resize_h: resizeHField.text,
-                crop_w: cropWField.text,
-                crop_h: cropHField.text,
-                crop_x: cropXField.text,
-                crop_y: cropYField.text,
-                rotate: root.canonicalOption(root.rotateCanonicalOptions, rotateCombo.currentIndex, rotateCombo.currentText),
-                speed: speedField.text,
-                subtitle_mode: subtitleModeCombo.currentText,
-                subtitle_path: subtitlePathField.text,
-                subtitle_stream: subtitleStreamSpin.value,
-                subtitle_out_fmt: outSubtitleFmt.currentText,
-                subtitle_language: subtitleLanguageField.text,
-                subtitle_model: subtitleModelCombo.currentText,
-                subtitle_engine: subtitleEngineCombo.currentText,
-                thumbnail_time: thumbnailTimeField.text,
-                sheet_cols: sheetColsSpin.value,
-                sheet_rows: sheetRowsSpin.value,
-                sheet_width: sheetWidthSpin.value,
-                sheet_interval: sheetIntervalSpin.value,
-                wm_path: wmPathField.text,
-                wm_pos: root.canonicalOption(root.positionCanonicalOptions, wmPosCombo.currentIndex, wmPosCombo.currentText),
-                wm_opacity: wmOpacitySpin.value,
-                wm_scale: wmScaleSpin.value,
-                text_wm: textWatermarkField.text,
-                text_pos: root.canonicalOption(root.positionCanonicalOptions, textPosCombo.currentIndex, textPosCombo.currentText),
-                text_size: textSizeSpin.value,
-                text_color: textColorField.text,
-                text_box: textBoxCheck.checked,
-                text_box_color: textBoxColorField.text,
-                text_box_opacity: textBoxOpacitySpin.value,
-                text_font: textFontField.text,
-                codec: codecCombo.currentText,
-                hw: hwCombo.currentText,
-                replace_audio_path: replaceAudioPathField.text,
-                normalize_audio: normalizeAudioCombo.currentText,
-                audio_peak_limit_db: peakLimitField.text,
-                trim_silence: trimSilenceCheck.checked,
-                silence_threshold_db: silenceThresholdSpin.value,
-                silence_duration: silenceDurationField.text,
-                split_chapters: splitChaptersCheck.checked,
-                cover_art_path: coverArtField.text,
-                before_hook: beforeHookField.text,
-                after_hook: afterHookField.text,
-                strip_metadata: stripMetadataCheck.checked,
-                copy_metadata: copyMetadataCheck.checked,
-                meta_title: metaTitleField.text,
-                meta_comment: metaCommentField.text,
-                meta_author: metaAuthorField.text,
-                meta_copyright: metaCopyrightField.text,
-                meta_album: metaAlbumField.text,
-                meta_genre: metaGenreField.text,
-                meta_year: metaYearField.text,
-                meta_track: metaTrackField.text,
-                device_profile: deviceProfileCombo.currentText,
-                privacy_blur_regions: privacyBlurRegionsField.text,
-                ai_blur_enabled: aiBlurCheck.checked,
-                sanitize_metadata: stripMetadataCheck.checked,
-                checksum_algorithm: checksumCombo.currentText,
-                secure_delete_original: secureDeleteCheck.checked,
-                subtitle_sync_ms: subtitleSyncField.text,
-                subtitle_style_enabled: subtitleStyleCheck.checked,
-                subtitle_font_name: subtitleFontNameField.text,
-                subtitle_font_size: subtitleFontSizeSpin.value,
-                subtitle_primary_color: subtitlePrimaryColorField.text,
-                subtitle_outline: subtitleOutlineSpin.value,
-                subtitle_shadow: subtitleShadowSpin.value,
-                subtitle_alignment: subtitleAlignmentSpin.value,
-                editor_deinterlace: editorDeinterlaceCheck.checked,
-                editor_stabilize: editorStabilizeCheck.checked,
-                editor_denoise: editorDenoiseCombo.currentText,
-                editor_brightness: editorBrightnessField.text,
-                editor_contrast: editorContrastField.text,
-                editor_saturation: editorSaturationField.text,
-                editor_gamma: editorGammaField.text,
-                editor_lut_path: editorLutPathField.text,
-                cloud_upload_enabled: cloudUploadCheck.checked,
-                cloud_provider: cloudProviderCombo.currentText,
-                cloud_rclone_path: cloudRclonePathField.text,
-                cloud_remote_path: cloudRemotePathField.text
+            // Cached until any schema control changes; callers get their own copy.
+            if (!_collectedSettings) {
+                var settings = {}
+                for (var i = 0; i < fieldSchema.length; ++i)
+                    settings[fieldSchema[i].key] = readField(fieldSchema[i])
+                _collectedSettings = settings
             }
+            return Object.assign({}, _collectedSettings)
+        }
+
+        Component.onCompleted: {
+            var signalFor = { combo: "currentTextChanged", canonical: "currentIndexChanged", text: "textChanged", check: "checkedChanged", spin: "valueChanged" }
+            for (var i = 0; i < fieldSchema.length; ++i)
+                fieldSchema[i].item[signalFor[fieldSchema[i].kind]].connect(invalidateCollectedSettings)
+            invalidateCollectedSettings()
         }
 
         function setPickedPath(kind, path) {
@@ -1,11 +1,13 @@
 import QtQuick 2.15
 import QtQuick.Layouts 1.15
-import QtQuick.Controls 2.15
 import App 1.0
 
-Label {
+// Plain Text rather than a Controls Label: these static captions need no
+// control/palette machinery, and there are close to a hundred of them.
+Text {
     color: Theme.textDisabled
     font.family: Theme.monoFont
     font.pixelSize: Theme.fontMeta
+    textFormat: Text.PlainText
     Layout.fillWidth: true
 }
@@ -30,6 +30,5 @@ Button {
         font.weight: Font.DemiBold
         font.pixelSize: Theme.fontSizeSm
         elide: Text.ElideRight
-        clip: true
     }
 }
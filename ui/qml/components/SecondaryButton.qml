@@ -30,6 +30,5 @@ Button {
         font.weight: Font.Medium
         font.pixelSize: Theme.fontSizeSm
         elide: Text.ElideRight
-        clip: true
     }
 }
@@ -9,7 +9,11 @@ import "../queue" as Queue
 Item {
     id: root
     property var appRoot
-    readonly property bool narrow: width < 1180
+    readonly property int narrowBreakpoint: 1180
+    readonly property int narrowHysteresis: 20
+    // Updated through narrowTimer so a live window drag does not relayout every row per pixel.
+    property bool narrow: false
+    property bool narrowResolved: false
     readonly property bool hasSelection: appRoot && appRoot.selectedPaths.length > 0
     readonly property bool batchSelection: appRoot && appRoot.selectedPaths.length > 1
 
@@ -18,6 +22,31 @@ Item {
             appRoot.clearQueueSelection()
     }
 
+    function applyNarrowMode() {
+        if (narrow) {
+            if (width >= narrowBreakpoint + narrowHysteresis)
+                narrow = false
+        } else if (width < narrowBreakpoint - narrowHysteresis) {
+            narrow = true
+        }
+    }
+
+    onWidthChanged: {
+        if (!narrowResolved && width > 0) {
+            narrow = width < narrowBreakpoint
+            narrowResolved = true
+        } else {
+            narrowTimer.restart()
+        }
+    }
+
+    Timer {
+        id: narrowTimer
+        interval: 50
+        repeat: false
+        onTriggered: root.applyNarrowMode()
+    }
+
     RowLayout {
         anchors.fill: parent
         spacing: 0
@@ -1,59 +1,141 @@
 ﻿import hashlib
+import os
 import re
+from collections.abc import Iterator
 from datetime import datetime
 from pathlib import Path
 
 from app.constants import AUDIO_EXTS, IMAGE_EXTS, SUBTITLE_EXTS, TEXT_EXTS, VIDEO_EXTS
 
+# Case-folded, immutable snapshots of the extension tables used on scan hot paths.
+_VIDEO_EXTS = frozenset(ext.lower() for ext in VIDEO_EXTS)
+_IMAGE_EXTS = frozenset(ext.lower() for ext in IMAGE_EXTS)
+_AUDIO_EXTS = frozenset(ext.lower() for ext in AUDIO_EXTS)
+_SUBTITLE_EXTS = frozenset(ext.lower() for ext in SUBTITLE_EXTS)
+_TEXT_EXTS = frozenset(ext.lower() for ext in TEXT_EXTS)
+_SUPPORTED_EXTS = _VIDEO_EXTS | _IMAGE_EXTS | _AUDIO_EXTS | _SUBTITLE_EXTS | _TEXT_EXTS
+# Later entries win, so an extension listed twice keeps media_type's old precedence.
+_MEDIA_TYPE_BY_EXT: dict[str, str] = {
+    **dict.fromkeys(_TEXT_EXTS, "text"),
+    **dict.fromkeys(_SUBTITLE_EXTS, "subtitle"),
+    **dict.fromkeys(_AUDIO_EXTS, "audio"),
+    **dict.fromkeys(_IMAGE_EXTS, "image"),
+    **dict.fromkeys(_VIDEO_EXTS, "video"),
+}
+
 
 def is_video(path: Path) -> bool:
-    return path.suffix.lower() in VIDEO_EXTS
+    return path.suffix.lower() in _VIDEO_EXTS
 
 
 def is_image(path: Path) -> bool:
-    return path.suffix.lower() in IMAGE_EXTS
+    return path.suffix.lower() in _IMAGE_EXTS
 
 
 def is_audio(path: Path) -> bool:
-    return path.suffix.lower() in AUDIO_EXTS
+    return path.suffix.lower() in _AUDIO_EXTS
 
 
 def is_subtitle(path: Path) -> bool:
-    return path.suffix.lower() in SUBTITLE_EXTS
+    return path.suffix.lower() in _SUBTITLE_EXTS
 
 
 def is_text(path: Path) -> bool:
-    return path.suffix.lower() in TEXT_EXTS
+    return path.suffix.lower() in _TEXT_EXTS
 
 
 def media_type(path: Path) -> str | None:
-    if is_video(path):
-        return "video"
-    if is_image(path):
-        return "image"
-    if is_audio(path):
-        return "audio"
-    if is_subtitle(path):
-        return "subtitle"
-    if is_text(path):
-        return "text"
-    return None
+    return _MEDIA_TYPE_BY_EXT.get(path.suffix.lower())
+
+
+def iter_media_files(root: Path) -> Iterator[Path]:
+    """Yield supported files under ``root`` depth-first, in name order per folder.
+
+    Uses ``os.scandir`` with an explicit stack so large trees are streamed
+    instead of materialised; unreadable folders and symlinked folders are skipped.
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError:
+            continue
+        subdirs = []
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif os.path.splitext(entry.name)[1].lower() in _SUPPORTED_EXTS and entry.is_file():
+                    yield Path(entry.path)
+            except OSError:
+                continue
+        stack.extend(reversed(subdirs))
 
 
 def safe_output_path(out_path: Path) -> Path:
+    """Return ``out_path`` or the first free ``name (N).ext`` beside it.
+
+    Collisions are resolved against one directory listing rather than a
+    ``stat`` per candidate, so crowded output folders stay cheap.
+    """
     if not out_path.exists():
         return out_path
     base = out_path.stem
     out_ext = out_path.suffix
     out_dir = out_path.parent
+    try:
+        taken = {os.path.normcase(name) for name in os.listdir(out_dir)}
+    except OSError:
+        taken = None
     i = 1
     while True:
-        candidate = out_dir / f"{base} ({i}){out_ext}"
-        if not candidate.exists():
-            return candidate
+        name = f"{base} ({i}){out_ext}"
+        if taken is None:
+            if not (out_dir / name).exists():
+                return out_dir / name
+        elif os.path.normcase(name) not in taken:
+            return out_dir / name
         i += 1
 
 
+class NameAllocator:
+    """Collision-free output names for a batch, from one listing per folder.
+
+    Like :func:`safe_output_path`, the desired name itself is checked with
+    ``exists()`` so the filesystem decides case sensitivity. Only the
+    ``name (N).ext`` candidates are resolved against a listing, taken once per
+    folder and reused. Names handed out with ``reserve=True`` count as taken
+    for later calls. Meant for one pass; it does not see files created meanwhile.
+    """
+
+    def __init__(self) -> None:
+        self._taken: dict[Path, set[str]] = {}
+
+    def _names(self, folder: Path) -> set[str]:
+        names = self._taken.get(folder)
+        if names is None:
+            try:
+                names = {os.path.normcase(name) for name in os.listdir(folder)}
+            except OSError:
+                names = set()
+            self._taken[folder] = names
+        return names
+
+    def allocate(self, out_path: Path, *, reserve: bool = True) -> Path:
+        taken = self._names(out_path.parent)
+        name = out_path.name
+        if os.path.normcase(name) in taken or out_path.exists():
+            i = 1
+            name = f"{out_path.stem} ({i}){out_path.suffix}"
+            while os.path.normcase(name) in taken:
+                i += 1
+                name = f"{out_path.stem} ({i}){out_path.suffix}"
+        if reserve:
+            taken.add(os.path.normcase(name))
+        return out_path.with_name(name)
+
+
 def file_sha256(path: Path, chunk_size: int = 1024 * 1024) -> str:
     digest = hashlib.sha256()
     with path.open("rb") as fh:
@@ -107,11 +189,14 @@ def build_output_path(
     media_type_name: str,
     overwrite: bool,
     skip_existing: bool,
+    allocator: NameAllocator | None = None,
 ) -> Path:
     stem = render_output_stem(template, in_path, index=index, operation=operation, media_type_name=media_type_name)
     desired = out_dir / f"{stem}.{out_ext.lstrip('.')}"
     if overwrite or skip_existing:
         return desired
+    if allocator is not None:
+        return allocator.allocate(desired, reserve=False)
     return safe_output_path(desired)
 
 
@@ -122,6 +207,7 @@ def build_merge_output_path(
     *,
     overwrite: bool,
     skip_existing: bool,
+    allocator: NameAllocator | None = None,
 ) -> Path:
     name = str(merge_name or "").strip() or "merged"
     out_path = Path(name)
@@ -131,4 +217,6 @@ def build_merge_output_path(
         out_path = out_dir / out_path.name
     if overwrite or skip_existing:
         return out_path
+    if allocator is not None:
+        return allocator.allocate(out_path, reserve=False)
     return safe_output_path(out_path)
@@ -1,10 +1,19 @@
 ﻿import re
+from functools import lru_cache
+
+# Plain "123" / "12.5" seconds; compiled once since progress parsing runs per stderr line.
+_DECIMAL_RE = re.compile(r"\d+(?:\.\d+)?")
 
 
 def format_time(seconds: float | None) -> str:
     if seconds is None or seconds < 0:
         return "--:--"
-    total = round(seconds)
+    return _format_clock(round(seconds))
+
+
+# Progress ticks keep asking for the same whole seconds (duration, slowly moving ETAs).
+@lru_cache(maxsize=2048)
+def _format_clock(total: int) -> str:
     h = total // 3600
     m = (total % 3600) // 60
     s = total % 60
@@ -13,23 +22,24 @@ def format_time(seconds: float | None) -> str:
     return f"{m:02d}:{s:02d}"
 
 
+_BYTE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
+
+@lru_cache(maxsize=1024)
 def format_bytes(size: int | None) -> str:
     if size is None:
         return "--"
-    value = float(size)
-    for unit in ["B", "KB", "MB", "GB", "TB"]:
-        if value < 1024.0:
-            return f"{value:.1f} {unit}"
-        value /= 1024.0
-    return f"{value:.1f} PB"
+    if size < 1024:
+        return f"{float(size):.1f} B"
+    # Each unit is 2**10 of the previous one, so the bit length picks it directly.
+    index = min((int(size).bit_length() - 1) // 10, len(_BYTE_UNITS) - 1)
+    return f"{size / (1 << (index * 10)):.1f} {_BYTE_UNITS[index]}"
 
 
 def parse_time_to_seconds(text: str) -> float | None:
     raw = text.strip()
-    if not raw:
-        return None
-    if re.fullmatch(r"\d+(\.\d+)?", raw):
-        return float(raw)
+    if ":" not in raw:
+        return float(raw) if _DECIMAL_RE.fullmatch(raw) else None
     parts = raw.split(":")
     try:
         if len(parts) == 2:
@@ -46,44 +56,41 @@ def parse_time_to_seconds(text: str) -> float | None:
     return None
 
 
+# int()/float() already ignore surrounding whitespace and reject blank input.
 def parse_float(text: str) -> float | None:
-    raw = text.strip()
-    if not raw:
-        return None
     try:
-        return float(raw)
-    except ValueError:
+        return float(text)
+    except (TypeError, ValueError):
         return None
 
 
 def parse_int(text: str) -> int | None:
-    raw = text.strip()
-    if not raw:
-        return None
     try:
-        return int(raw)
-    except ValueError:
+        return int(text)
+    except (TypeError, ValueError):
         return None
 
 
 def parse_ffmpeg_time(value: str) -> float | None:
+    # Runs for every progress line, so split HH:MM:SS with partition rather than a list.
     raw = value.strip()
-    if not raw:
+    hours, sep, rest = raw.partition(":")
+    if not sep:
+        return float(raw) if _DECIMAL_RE.fullmatch(raw) else None
+    minutes, sep, seconds = rest.partition(":")
+    if not sep:
+        return None
+    try:
+        return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+    except ValueError:
         return None
-    if re.fullmatch(r"\d+(\.\d+)?", raw):
-        return float(raw)
-    parts = raw.split(":")
-    if len(parts) == 3:
-        try:
-            return int(parts[0]) * 3600 + int(parts[1]) * 60 + float(parts[2])
-        except ValueError:
-            return None
-    return None
 
 
-def build_atempo_chain(speed: float) -> list[float]:
+# Presets reuse a handful of speeds; results are tuples so cached values stay immutable.
+@lru_cache(maxsize=128)
+def build_atempo_chain(speed: float) -> tuple[float, ...]:
     if speed <= 0:
-        return []
+        return ()
     factors: list[float] = []
     while speed > 2.0:
         factors.append(2.0)
@@ -92,4 +99,4 @@ def build_atempo_chain(speed: float) -> list[float]:
         factors.append(0.5)
         speed /= 0.5
     factors.append(speed)
-    return factors
+    return tuple(factors)
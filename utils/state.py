@@ -5,6 +5,11 @@ import tempfile
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # optional speed-up; stdlib json is the fallback
+    orjson = None
+
 
 def load_json_state(path: Path) -> dict[str, Any]:
     data = load_json_file(path)
@@ -12,29 +17,57 @@ def load_json_state(path: Path) -> dict[str, Any]:
 
 
 def load_json_file(path: Path) -> Any:
-    if not path.exists():
-        return None
+    # A missing file is just an OSError; decode errors from json/orjson are ValueErrors.
     try:
-        with path.open("r", encoding="utf-8") as fh:
-            data = json.load(fh)
-    except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+        return loads_json(path.read_bytes())
+    except (OSError, ValueError):
         return None
-    return data
 
 
 def save_json_state(path: Path, state: dict[str, Any]) -> None:
     save_json_file(path, state)
 
 
+def loads_json(text: str | bytes) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except ValueError:
+            pass  # orjson rejects the NaN/Infinity tokens the stdlib writer emits
+    return json.loads(text)
+
+
+def dumps_json(state: Any) -> str:
+    return _dumps_json_bytes(state).decode("utf-8")
+
+
 def save_json_file(path: Path, state: Any) -> None:
+    write_bytes_atomic(path, _dumps_json_bytes(state))
+
+
+def _dumps_json_bytes(state: Any) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(state, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass
+    return json.dumps(state, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def write_text_atomic(path: Path, text: str) -> None:
+    write_bytes_atomic(path, text.encode("utf-8"))
+
+
+def write_bytes_atomic(path: Path, data: bytes) -> None:
+    """Replace ``path`` with ``data`` via a temp file, in a single buffered write."""
     path.parent.mkdir(parents=True, exist_ok=True)
     tmp_fd = -1
     tmp_path = ""
     try:
         tmp_fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
-        with os.fdopen(tmp_fd, "w", encoding="utf-8") as fh:
+        with os.fdopen(tmp_fd, "wb") as fh:
             tmp_fd = -1
-            json.dump(state, fh, ensure_ascii=False, indent=2)
+            fh.write(data)
         os.replace(tmp_path, path)
         with contextlib.suppress(OSError):
             os.chmod(path, 0o600)